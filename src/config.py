@@ -33,6 +33,11 @@ class Settings(BaseSettings):
     api_auth_key: str = ""  # Required for API access (X-API-Key header)
     api_rate_limit: int = 60  # Requests per minute
 
+    # Agent runner pool
+    agent_pool_max_idle: int = 2  # Idle AgentRunners kept per user
+    agent_pool_max_keys: int = 64  # Users with idle runners (LRU)
+    agent_pool_idle_ttl: float = 600.0  # Seconds before an idle runner is closed
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -1,7 +1,14 @@
 """Agent core module."""
 
 from src.core.agent.factory import AgentFactory
+from src.core.agent.pool import AgentRunnerPool, get_agent_runner_pool
 from src.core.agent.runner import AgentRunner
 from src.core.agent.utils import AgentRunResult
 
-__all__ = ["AgentRunner", "AgentFactory", "AgentRunResult"]
+__all__ = [
+    "AgentRunner",
+    "AgentFactory",
+    "AgentRunResult",
+    "AgentRunnerPool",
+    "get_agent_runner_pool",
+]
@@ -126,13 +126,23 @@ class AgentFactory:
         """Get the list of available tools."""
         return list(self._toolset.tools.values())
 
+    def cleanup_files(self) -> int:
+        """Delete files MCP servers left behind (e.g. screenshots), sync.
+
+        Returns:
+            Number of files deleted.
+        """
+        if not self._mcp_manager or not self._mcp_manager.needs_cleanup():
+            return 0
+        deleted = self._mcp_manager.cleanup_files_sync()
+        if deleted > 0:
+            logger.info("AgentFactory: Cleaned up %d file(s)", deleted)
+        return deleted
+
     def close(self) -> None:
         """Sync cleanup."""
         if self._mcp_manager:
-            if self._mcp_manager.needs_cleanup():
-                deleted = self._mcp_manager.cleanup_files_sync()
-                if deleted > 0:
-                    logger.info("AgentFactory: Cleaned up %d file(s)", deleted)
+            self.cleanup_files()
             self._mcp_manager.disconnect_all()
             logger.info("AgentFactory: MCP connections closed")
 
@@ -0,0 +1,161 @@
+"""Pool of reusable AgentRunner instances.
+
+Building an AgentRunner assembles the toolset, creates MCP server instances
+and a fresh Agent. The pool keeps idle runners per key (typically the user ID
+the guardrails are bound to) so back-to-back requests skip that setup. Keys
+are kept in LRU order and runners idle for longer than idle_ttl are closed.
+
+Example:
+    >>> pool = get_agent_runner_pool()
+    >>> async with pool.acquire("U123", lambda: AgentRunner(...)) as runner:
+    ...     result = await runner.run_async("Hello")
+"""
+
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable
+from contextlib import asynccontextmanager
+
+from src.config import settings
+from src.core.agent.runner import AgentRunner
+
+logger = logging.getLogger(__name__)
+
+
+class AgentRunnerPool:
+    """Keeps idle AgentRunners per key for reuse across requests.
+
+    A runner is checked out exclusively for the duration of acquire(). On
+    success its run files are cleaned up and it is returned to its key's idle
+    queue (closed if the queue is full); it is closed and discarded if the
+    body raises. When more than max_keys keys
+    hold idle runners, the least recently used key's runners are closed.
+
+    Attributes:
+        max_idle_per_key: Maximum idle runners retained per key.
+        max_keys: Maximum number of keys with idle runners.
+        idle_ttl: Seconds an idle runner is kept before being closed.
+    """
+
+    def __init__(
+        self,
+        max_idle_per_key: int = 2,
+        max_keys: int = 64,
+        idle_ttl: float = 600.0,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_idle_per_key: Maximum idle runners retained per key.
+            max_keys: Maximum number of keys with idle runners.
+            idle_ttl: Seconds an idle runner is kept before being closed.
+        """
+        self.max_idle_per_key = max_idle_per_key
+        self.max_keys = max_keys
+        self.idle_ttl = idle_ttl
+        # key -> (released_at, runner), most recently used key last
+        self._idle: OrderedDict[Hashable, deque[tuple[float, AgentRunner]]] = (
+            OrderedDict()
+        )
+
+    @asynccontextmanager
+    async def acquire(
+        self, key: Hashable, factory: Callable[[], AgentRunner]
+    ) -> AsyncIterator[AgentRunner]:
+        """Check out a runner for key, creating one with factory if none is idle.
+
+        Args:
+            key: Pool key; runners are only reused for the same key.
+            factory: Zero-argument callable building a new AgentRunner.
+
+        Yields:
+            AgentRunner reserved for the caller.
+        """
+        self._evict_expired()
+        idle = self._idle.get(key)
+        if idle:
+            _, runner = idle.pop()
+        else:
+            runner = factory()
+            logger.debug("AgentRunnerPool: created runner for %s", key)
+
+        try:
+            yield runner
+        except BaseException:
+            runner.close()
+            raise
+
+        # Per-run files (e.g. screenshots) were deleted by close() before
+        # runners were pooled; delete them now rather than when evicted
+        try:
+            runner.cleanup_files()
+        except Exception as e:
+            logger.warning("AgentRunnerPool: failed to clean up run files: %s", e)
+
+        idle = self._idle.setdefault(key, deque())
+        self._idle.move_to_end(key)
+        if len(idle) < self.max_idle_per_key:
+            idle.append((time.monotonic(), runner))
+        else:
+            runner.close()
+
+        while len(self._idle) > self.max_keys:
+            _, evicted = self._idle.popitem(last=False)
+            self._close_all(evicted)
+
+    def _evict_expired(self) -> None:
+        """Close runners that have been idle for longer than idle_ttl."""
+        deadline = time.monotonic() - self.idle_ttl
+        for key in list(self._idle):
+            idle = self._idle[key]
+            # Runners are appended on release, so the oldest are on the left
+            while idle and idle[0][0] < deadline:
+                self._close_all([idle.popleft()])
+            if not idle:
+                del self._idle[key]
+
+    @staticmethod
+    def _close_all(entries: Iterable[tuple[float, AgentRunner]]) -> None:
+        """Close runners, logging (not raising) failures."""
+        for _, runner in entries:
+            try:
+                runner.close()
+            except Exception as e:
+                logger.warning("AgentRunnerPool: failed to close runner: %s", e)
+
+    def idle_count(self, key: Hashable | None = None) -> int:
+        """Get the number of idle runners.
+
+        Args:
+            key: Count only this key's runners. Counts all keys if None.
+
+        Returns:
+            Number of idle runners.
+        """
+        if key is not None:
+            return len(self._idle.get(key, ()))
+        return sum(len(idle) for idle in self._idle.values())
+
+    def shutdown(self) -> None:
+        """Close all idle runners (lifecycle hook)."""
+        for idle in self._idle.values():
+            self._close_all(idle)
+        self._idle.clear()
+        logger.info("AgentRunnerPool: all idle runners closed")
+
+
+# Singleton instance
+_pool: AgentRunnerPool | None = None
+
+
+def get_agent_runner_pool() -> AgentRunnerPool:
+    """Get the singleton AgentRunnerPool instance."""
+    global _pool
+    if _pool is None:
+        _pool = AgentRunnerPool(
+            max_idle_per_key=settings.agent_pool_max_idle,
+            max_keys=settings.agent_pool_max_keys,
+            idle_ttl=settings.agent_pool_idle_ttl,
+        )
+    return _pool
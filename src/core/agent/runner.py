@@ -321,6 +321,16 @@ class AgentRunner:
         """
         return self._message_history.copy()
 
+    def cleanup_files(self) -> int:
+        """Delete files MCP servers left behind during runs (e.g. screenshots).
+
+        Keeps MCP connections open, so the runner can be reused afterwards.
+
+        Returns:
+            Number of files deleted.
+        """
+        return self._factory.cleanup_files()
+
     def close(self) -> None:
         """Close MCP connections and executor (sync).
 
@@ -7,10 +7,11 @@ This module provides:
 - parse_command: Function to parse user input for commands
 - build_command_prompt: Function to build prompts from commands
 - CommandExecutor: Executor for processing parsed commands
+- get_command_executor: Shared CommandExecutor bound to the repository singleton
 - CRUD tools: create_command, list_commands, get_command, update_command, delete_command
 """
 
-from src.core.commands.executor import CommandExecutor
+from src.core.commands.executor import CommandExecutor, get_command_executor
 from src.core.commands.models import Command
 from src.core.commands.parser import ParsedCommand, parse_command
 from src.core.commands.prompts import build_command_prompt
@@ -31,6 +32,7 @@ __all__ = [
     "parse_command",
     "build_command_prompt",
     "CommandExecutor",
+    "get_command_executor",
     "create_command",
     "list_commands",
     "get_command",
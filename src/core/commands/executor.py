@@ -7,7 +7,7 @@ lookup and prompt building for execution.
 
 from src.core.commands.parser import ParsedCommand
 from src.core.commands.prompts import build_command_prompt
-from src.core.commands.repository import CommandRepository
+from src.core.commands.repository import CommandRepository, get_repository
 
 
 class CommandExecutor:
@@ -69,3 +69,21 @@ class CommandExecutor:
         return build_command_prompt(
             command, parsed_cmd.input, user_id, parsed_cmd.additional_instructions
         )
+
+
+_executor: CommandExecutor | None = None
+
+
+def get_command_executor() -> CommandExecutor:
+    """Get the singleton CommandExecutor instance.
+
+    The executor is bound to the shared CommandRepository so command lookups
+    don't re-initialize the commands database on every request.
+
+    Returns:
+        CommandExecutor singleton instance.
+    """
+    global _executor
+    if _executor is None:
+        _executor = CommandExecutor(get_repository())
+    return _executor
@@ -12,7 +12,14 @@ from contextlib import asynccontextmanager
 from typing import Annotated, Any
 
 from dotenv import load_dotenv
-from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request
+from fastapi import (
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    Response,
+)
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
@@ -20,14 +27,17 @@ from slowapi.errors import RateLimitExceeded
 load_dotenv()
 
 from src.config import settings  # noqa: E402
+from src.core.agent.pool import get_agent_runner_pool  # noqa: E402
 from src.core.commands import tools as command_tools  # noqa: E402
 from src.core.commands.repository import get_repository  # noqa: E402
 from src.core.lifecycle import get_lifecycle_manager  # noqa: E402
 from src.core.scheduler.manager import SchedulerManager  # noqa: E402
 from src.interfaces.api.schemas import (  # noqa: E402
+    STATUS_RESPONSE_ADAPTER,
     CommandCreate,
     CommandResponse,
     CommandUpdate,
+    ImageDataResponse,
     RunRequest,
     RunResponse,
     StatusResponse,
@@ -38,7 +48,10 @@ from src.interfaces.api.security import (  # noqa: E402
     verify_api_key,
 )
 from src.interfaces.api.task_repository import get_task_repository  # noqa: E402
-from src.interfaces.api.tasks import execute_agent  # noqa: E402
+from src.interfaces.api.tasks import (  # noqa: E402
+    close_webhook_client,
+    execute_agent,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,11 +70,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     lifecycle = get_lifecycle_manager()
     lifecycle.register("scheduler", SchedulerManager.get_instance())
+    lifecycle.register("agent_runner_pool", get_agent_runner_pool())
     await lifecycle.startup()
 
     yield
 
     await lifecycle.shutdown()
+    await close_webhook_client()
     logger.info("Shutting down...")
 
 
@@ -125,9 +140,7 @@ async def run_agent(
 
 @app.get("/status/{task_id}", response_model=StatusResponse)
 @limiter.limit(get_rate_limit_string)
-async def get_status(
-    request: Request, task_id: str, _api_key: ApiKey
-) -> StatusResponse:
+async def get_status(request: Request, task_id: str, _api_key: ApiKey) -> Response:
     """Get the status of a task.
 
     Returns the current status and results (if completed) for
@@ -137,7 +150,7 @@ async def get_status(
         task_id: Unique identifier for the task.
 
     Returns:
-        StatusResponse with current status and results.
+        JSON response serialized from StatusResponse.
 
     Raises:
         HTTPException: If task_id is not found.
@@ -148,7 +161,8 @@ async def get_status(
     if task is None:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
-    return StatusResponse(
+    # Task rows were validated when written, so skip re-validation here
+    status_response = StatusResponse.model_construct(
         task_id=task_id,
         status=task.status,
         result=task.result,
@@ -156,7 +170,11 @@ async def get_status(
         execution_time=task.execution_time,
         tool_calls=task.tool_calls,
         model_used=task.model_used,
-        images=task.images,
+        images=[ImageDataResponse.model_construct(**img) for img in task.images],
+    )
+    return Response(
+        content=STATUS_RESPONSE_ADAPTER.dump_json(status_response),
+        media_type="application/json",
     )
 
 
@@ -6,7 +6,7 @@ Defines request and response schemas for the agent API endpoints.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class RunRequest(BaseModel):
@@ -78,6 +78,11 @@ class StatusResponse(BaseModel):
     )
 
 
+# Built once at import so /status serializes straight to JSON bytes in
+# pydantic-core instead of going through FastAPI's jsonable_encoder.
+STATUS_RESPONSE_ADAPTER: TypeAdapter[StatusResponse] = TypeAdapter(StatusResponse)
+
+
 class CommandCreate(BaseModel):
     """Request body for POST /commands endpoint.
 
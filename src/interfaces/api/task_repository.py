@@ -10,16 +10,79 @@ import json
 import logging
 import os
 import sqlite3
+import threading
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Bump when the tasks table layout changes; _migrate() upgrades older files
+SCHEMA_VERSION = 2
+
+# Task status is stored as a small integer; index == stored code
+_STATUS_NAMES = ("pending", "success", "error")
+_STATUS_CODES = {name: code for code, name in enumerate(_STATUS_NAMES)}
+
+# STRICT tables (type-checked columns) need SQLite 3.37+
+_TABLE_OPTIONS = " STRICT" if sqlite3.sqlite_version_info >= (3, 37, 0) else ""
+
+_SQL_CREATE_TABLE = f"""
+    CREATE TABLE IF NOT EXISTS tasks (
+        task_id TEXT PRIMARY KEY,
+        status INTEGER NOT NULL,
+        result TEXT,
+        error_message TEXT,
+        execution_time REAL,
+        tool_calls TEXT NOT NULL,
+        model_used TEXT NOT NULL,
+        images TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        updated_at REAL NOT NULL
+    ){_TABLE_OPTIONS}
+"""
+
+_SQL_INSERT = """
+    INSERT INTO tasks (
+        task_id, status, result, error_message, execution_time,
+        tool_calls, model_used, images, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET = "SELECT * FROM tasks WHERE task_id = ?"
+
+_SQL_UPDATE = """
+    UPDATE tasks SET
+        status = ?,
+        result = ?,
+        error_message = ?,
+        execution_time = ?,
+        tool_calls = ?,
+        images = ?,
+        updated_at = ?
+    WHERE task_id = ?
+"""
+
+_SQL_CLEANUP = f"""
+    DELETE FROM tasks
+    WHERE status != {_STATUS_CODES["pending"]} AND updated_at < ?
+"""
+
+# Compiled statements kept per connection (sqlite3 default is 128)
+_CACHED_STATEMENTS = 256
 
-@dataclass
+# Compact encoder shared by all writes (base64 image payloads dominate the
+# serialized size, so drop the default separator padding)
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+@dataclass(slots=True)
 class TaskRecord:
-    """Represents a stored task record."""
+    """Represents a stored task record.
+
+    Timestamps are Unix epoch seconds as stored in the database; convert with
+    datetime.fromtimestamp() only where a datetime is actually needed.
+    """
 
     task_id: str
     status: str  # "pending", "success", "error"
@@ -29,15 +92,17 @@ class TaskRecord:
     tool_calls: list[str]
     model_used: str
     images: list[dict]  # Serialized ImageDataResponse
-    created_at: datetime
-    updated_at: datetime
+    created_at: float
+    updated_at: float
 
 
 class TaskRepository:
     """Repository for storing and retrieving API tasks from SQLite.
 
     Provides CRUD operations with automatic cleanup of old tasks.
-    The repository auto-creates the database directory and table on initialization.
+    The repository auto-creates the database directory and table on initialization
+    and keeps one connection open so sqlite3's statement cache is reused
+    across calls.
 
     Attributes:
         db_path: Path to the SQLite database file.
@@ -63,28 +128,29 @@ class TaskRepository:
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
 
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            db_path,
+            cached_statements=_CACHED_STATEMENTS,
+            check_same_thread=False,
+        )
         self._init_db()
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        conn = self._conn
+        with self._lock:
             conn.execute("PRAGMA journal_mode=WAL")
 
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    task_id TEXT PRIMARY KEY,
-                    status TEXT NOT NULL,
-                    result TEXT,
-                    error_message TEXT,
-                    execution_time REAL,
-                    tool_calls TEXT NOT NULL,
-                    model_used TEXT NOT NULL,
-                    images TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL
-                )
-            """)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < SCHEMA_VERSION:
+                has_tasks = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks'"
+                ).fetchone()
+                if has_tasks:
+                    self._migrate(conn, version)
+
+            conn.execute(_SQL_CREATE_TABLE)
 
             # Index for cleanup queries
             conn.execute("""
@@ -92,23 +158,56 @@ class TaskRepository:
                 ON tasks(updated_at)
             """)
 
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             conn.commit()
-        finally:
-            conn.close()
+
+    def _migrate(self, conn: sqlite3.Connection, version: int) -> None:
+        """Rebuild a tasks table created by an older schema version.
+
+        Args:
+            conn: Open connection (caller commits).
+            version: user_version found in the database.
+        """
+        logger.info("Migrating tasks table from schema v%d", version)
+        conn.execute("DROP INDEX IF EXISTS idx_tasks_updated_at")
+        conn.execute("ALTER TABLE tasks RENAME TO tasks_old")
+        conn.execute(_SQL_CREATE_TABLE)
+        if version == 0:
+            # v0 stored naive local ISO timestamps
+            created_at = "CAST(strftime('%s', created_at, 'utc') AS REAL)"
+            updated_at = "CAST(strftime('%s', updated_at, 'utc') AS REAL)"
+        else:
+            created_at, updated_at = "created_at", "updated_at"
+        # v0 and v1 stored status as text
+        conn.execute(f"""
+            INSERT INTO tasks
+            SELECT
+                task_id,
+                CASE status
+                    WHEN 'pending' THEN {_STATUS_CODES["pending"]}
+                    WHEN 'success' THEN {_STATUS_CODES["success"]}
+                    ELSE {_STATUS_CODES["error"]}
+                END,
+                result, error_message, execution_time,
+                tool_calls, model_used, images,
+                {created_at}, {updated_at}
+            FROM tasks_old
+        """)
+        conn.execute("DROP TABLE tasks_old")
 
     def _row_to_task(self, row: tuple) -> TaskRecord:
         """Convert a database row to a TaskRecord."""
         return TaskRecord(
             task_id=row[0],
-            status=row[1],
+            status=_STATUS_NAMES[row[1]],
             result=row[2],
             error_message=row[3],
             execution_time=row[4],
             tool_calls=json.loads(row[5]),
             model_used=row[6],
             images=json.loads(row[7]),
-            created_at=datetime.fromisoformat(row[8]),
-            updated_at=datetime.fromisoformat(row[9]),
+            created_at=row[8],
+            updated_at=row[9],
         )
 
     def create(
@@ -123,45 +222,37 @@ class TaskRepository:
         Returns:
             Created TaskRecord with pending status.
         """
-        now = datetime.now()
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                """
-                INSERT INTO tasks (
-                    task_id, status, result, error_message, execution_time,
-                    tool_calls, model_used, images, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                _SQL_INSERT,
                 (
                     task_id,
-                    "pending",
+                    _STATUS_CODES["pending"],
                     None,
                     None,
                     None,
-                    json.dumps([]),
+                    "[]",
                     model_used,
-                    json.dumps([]),
-                    now.isoformat(),
-                    now.isoformat(),
+                    "[]",
+                    now,
+                    now,
                 ),
             )
-            conn.commit()
+            self._conn.commit()
 
-            return TaskRecord(
-                task_id=task_id,
-                status="pending",
-                result=None,
-                error_message=None,
-                execution_time=None,
-                tool_calls=[],
-                model_used=model_used,
-                images=[],
-                created_at=now,
-                updated_at=now,
-            )
-        finally:
-            conn.close()
+        return TaskRecord(
+            task_id=task_id,
+            status="pending",
+            result=None,
+            error_message=None,
+            execution_time=None,
+            tool_calls=[],
+            model_used=model_used,
+            images=[],
+            created_at=now,
+            updated_at=now,
+        )
 
     def get(self, task_id: str) -> TaskRecord | None:
         """Retrieve a task by ID.
@@ -172,18 +263,11 @@ class TaskRepository:
         Returns:
             TaskRecord if found, None otherwise.
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute(
-                "SELECT * FROM tasks WHERE task_id = ?",
-                (task_id,),
-            )
-            row = cursor.fetchone()
-            if row is None:
-                return None
-            return self._row_to_task(row)
-        finally:
-            conn.close()
+        with self._lock:
+            row = self._conn.execute(_SQL_GET, (task_id,)).fetchone()
+        if row is None:
+            return None
+        return self._row_to_task(row)
 
     def update(
         self,
@@ -209,40 +293,27 @@ class TaskRepository:
         Returns:
             Updated TaskRecord, or None if task not found.
         """
-        now = datetime.now()
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute(
-                """
-                UPDATE tasks SET
-                    status = ?,
-                    result = ?,
-                    error_message = ?,
-                    execution_time = ?,
-                    tool_calls = ?,
-                    images = ?,
-                    updated_at = ?
-                WHERE task_id = ?
-                """,
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                _SQL_UPDATE,
                 (
-                    status,
+                    _STATUS_CODES[status],
                     result,
                     error_message,
                     execution_time,
-                    json.dumps(tool_calls or []),
-                    json.dumps(images or []),
-                    now.isoformat(),
+                    _JSON_ENCODER.encode(tool_calls or []),
+                    _JSON_ENCODER.encode(images or []),
+                    now,
                     task_id,
                 ),
             )
-            conn.commit()
+            self._conn.commit()
 
             if cursor.rowcount == 0:
                 return None
 
             return self.get(task_id)
-        finally:
-            conn.close()
 
     def cleanup_old_tasks(self) -> int:
         """Remove tasks older than retention period.
@@ -250,23 +321,19 @@ class TaskRepository:
         Returns:
             Number of tasks deleted.
         """
-        cutoff = datetime.now() - timedelta(hours=self.retention_hours)
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute(
-                """
-                DELETE FROM tasks
-                WHERE status != 'pending' AND updated_at < ?
-                """,
-                (cutoff.isoformat(),),
-            )
-            conn.commit()
-            deleted = cursor.rowcount
-            if deleted > 0:
-                logger.info("Cleaned up %d old tasks", deleted)
-            return deleted
-        finally:
-            conn.close()
+        cutoff = time.time() - self.retention_hours * 3600
+        with self._lock:
+            cursor = self._conn.execute(_SQL_CLEANUP, (cutoff,))
+            self._conn.commit()
+        deleted = cursor.rowcount
+        if deleted > 0:
+            logger.info("Cleaned up %d old tasks", deleted)
+        return deleted
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
     def to_dict(self, task: TaskRecord) -> dict[str, Any]:
         """Convert TaskRecord to dict for API response."""
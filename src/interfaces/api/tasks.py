@@ -16,9 +16,9 @@ import tenacity
 
 from src.config import settings
 from src.core.agent.core import AgentRunner
-from src.core.commands.executor import CommandExecutor
+from src.core.agent.pool import get_agent_runner_pool
+from src.core.commands.executor import get_command_executor
 from src.core.commands.parser import parse_command
-from src.core.commands.repository import CommandRepository
 from src.interfaces.api.schemas import ImageDataResponse, RunRequest, WebhookPayload
 from src.interfaces.api.task_repository import TaskRepository, get_task_repository
 from src.middleware.guardrails import GuardrailConfig
@@ -29,6 +29,9 @@ logger = logging.getLogger(__name__)
 # Default model identifier
 DEFAULT_MODEL = "gemini/gemini-3-flash-preview"
 
+# Shared webhook client so retries and later tasks reuse pooled connections
+_webhook_client: httpx.AsyncClient | None = None
+
 
 def get_tasks_store() -> TaskRepository:
     """Get the task repository (SQLite-backed).
@@ -39,15 +42,47 @@ def get_tasks_store() -> TaskRepository:
     return get_task_repository()
 
 
-@tenacity.retry(
+def get_webhook_client() -> httpx.AsyncClient:
+    """Get the shared webhook HTTP client, creating it on first use.
+
+    Returns:
+        httpx.AsyncClient with a keep-alive connection pool.
+    """
+    global _webhook_client
+    if _webhook_client is None or _webhook_client.is_closed:
+        _webhook_client = httpx.AsyncClient(
+            timeout=20.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        )
+    return _webhook_client
+
+
+async def close_webhook_client() -> None:
+    """Close the shared webhook HTTP client (call on app shutdown)."""
+    global _webhook_client
+    if _webhook_client is not None:
+        await _webhook_client.aclose()
+        _webhook_client = None
+
+
+# Transient webhook failures worth retrying
+_WEBHOOK_RETRY_EXCEPTIONS = (
+    httpx.TimeoutException,
+    httpx.ConnectError,
+    httpx.HTTPStatusError,
+)
+
+# Built once; send_webhook iterates a copy() since iteration state lives
+# on the instance and webhooks may be sent concurrently
+_WEBHOOK_RETRY = tenacity.AsyncRetrying(
     stop=tenacity.stop_after_attempt(5),
     wait=tenacity.wait_exponential(multiplier=1, min=1, max=60),
-    retry=tenacity.retry_if_exception_type(
-        (httpx.TimeoutException, httpx.ConnectError, httpx.HTTPStatusError)
-    ),
+    retry=tenacity.retry_if_exception_type(_WEBHOOK_RETRY_EXCEPTIONS),
     retry_error_callback=lambda _: None,  # Don't raise on final failure
     reraise=False,
 )
+
+
 async def send_webhook(
     url: str,
     payload: dict[str, Any],
@@ -70,29 +105,25 @@ async def send_webhook(
     if headers:
         request_headers.update(headers)
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        response = await client.post(url, json=payload, headers=request_headers)
-        response.raise_for_status()
-        logger.info("Webhook sent successfully to %s", url)
-        return True
+    client = get_webhook_client()
+    async for attempt in _WEBHOOK_RETRY.copy():
+        with attempt:
+            response = await client.post(url, json=payload, headers=request_headers)
+            response.raise_for_status()
+            logger.info("Webhook sent successfully to %s", url)
+            return True
+    return False
 
 
-def _images_to_response(images: list[ImageData]) -> list[ImageDataResponse]:
-    return [
-        ImageDataResponse(
-            data=base64.b64encode(img.data).decode("utf-8"),
-            mime_type=img.mime_type,
-            filename=img.filename,
-        )
-        for img in images
-    ]
+def _images_to_dict(images: list[ImageData]) -> list[dict]:
+    """Convert ImageData list to base64 dicts for storage.
 
-
-def _images_to_dict(images: list[ImageDataResponse]) -> list[dict]:
-    """Convert ImageDataResponse list to dict list for storage."""
+    Builds the stored shape of ImageDataResponse directly, skipping an
+    intermediate model per image that would only be dumped back to a dict.
+    """
     return [
         {
-            "data": img.data,
+            "data": base64.b64encode(img.data).decode("ascii"),
             "mime_type": img.mime_type,
             "filename": img.filename,
         }
@@ -113,7 +144,6 @@ async def execute_agent(
     repo = get_tasks_store()
     start_time = time.time()
     tool_calls: list[str] = []
-    images: list[ImageDataResponse] = []
 
     prompt = request.prompt
     user_id = request.user_id or "anonymous"
@@ -122,29 +152,31 @@ async def execute_agent(
     # Check for command
     parsed_cmd = parse_command(prompt)
     if parsed_cmd:
-        executor = CommandExecutor(CommandRepository("data/commands.db"))
-        cmd_prompt = executor.execute(parsed_cmd, user_id=full_user_id)
+        cmd_prompt = get_command_executor().execute(parsed_cmd, user_id=full_user_id)
         if cmd_prompt:
             prompt = cmd_prompt
 
-    guardrail_config = GuardrailConfig(current_user_id=user_id) if user_id else None
-    runner = AgentRunner(
-        api_key=settings.api_key,
-        enable_mcp=True,
-        guardrail_config=guardrail_config,
-    )
-    logger.info("Created AgentRunner for user %s", user_id)
+    def _create_runner() -> AgentRunner:
+        guardrail_config = GuardrailConfig(current_user_id=user_id)
+        logger.info("Creating AgentRunner for user %s", user_id)
+        return AgentRunner(
+            api_key=settings.api_key,
+            enable_mcp=True,
+            guardrail_config=guardrail_config,
+        )
 
     try:
-        if request.user_id:
-            run_result = await runner.run_async_with_user(
-                prompt, request.user_id, platform="api"
-            )
-        else:
-            run_result = await runner.run_async(prompt)
+        # Runners are keyed by user since the guardrail config is user-bound;
+        # the pool closes the runner instead of returning it if the run fails
+        async with get_agent_runner_pool().acquire(user_id, _create_runner) as runner:
+            if request.user_id:
+                run_result = await runner.run_async_with_user(
+                    prompt, request.user_id, platform="api"
+                )
+            else:
+                run_result = await runner.run_async(prompt)
 
         execution_time = time.time() - start_time
-        images = _images_to_response(run_result.images)
 
         repo.update(
             task_id=task_id,
@@ -153,7 +185,7 @@ async def execute_agent(
             error_message=None,
             execution_time=execution_time,
             tool_calls=tool_calls,
-            images=_images_to_dict(images),
+            images=_images_to_dict(run_result.images),
         )
 
         logger.info("Task %s completed successfully in %.2fs", task_id, execution_time)
@@ -173,9 +205,6 @@ async def execute_agent(
 
         logger.error("Task %s failed: %s", task_id, str(e))
 
-    finally:
-        runner.close()
-
     # Send webhook if configured
     if request.webhook_url:
         task = repo.get(task_id)
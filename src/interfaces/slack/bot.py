@@ -21,6 +21,7 @@ load_dotenv()
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 
 from src.config import settings
+from src.core.agent.pool import get_agent_runner_pool
 from src.core.lifecycle import get_lifecycle_manager
 from src.core.scheduler.manager import SchedulerManager
 from src.core.scheduler.notification import SlackNotifier
@@ -32,6 +33,7 @@ from src.interfaces.slack.handlers import (
     process_mention,
     process_reaction,
 )
+from src.utils.slack_files import close_aiohttp_session, get_aiohttp_session
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +88,9 @@ def create_bot(
 async def start_bot(bot_token: str | None = None, app_token: str | None = None) -> None:
     """Start the Slack bot with Socket Mode."""
     slack_app, handler = create_bot(bot_token, app_token)
+    # Without a session AsyncWebClient opens (and TLS-handshakes) a new
+    # aiohttp session per API call; share the pooled one used for file downloads
+    slack_app.client.session = await get_aiohttp_session()
 
     scheduler = SchedulerManager.get_instance()
     scheduler.set_slack_client(slack_app.client)
@@ -93,6 +98,7 @@ async def start_bot(bot_token: str | None = None, app_token: str | None = None)
 
     lifecycle = get_lifecycle_manager()
     lifecycle.register("scheduler", scheduler)
+    lifecycle.register("agent_runner_pool", get_agent_runner_pool())
     await lifecycle.startup()
 
     logger.info("Starting Slack bot with Socket Mode...")
@@ -103,6 +109,7 @@ async def start_bot(bot_token: str | None = None, app_token: str | None = None)
     finally:
         await lifecycle.shutdown()
         await handler.close_async()
+        await close_aiohttp_session()
         logger.info("Slack bot stopped")
 
 
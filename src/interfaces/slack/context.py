@@ -5,7 +5,11 @@ Provides functions to fetch and format conversation context from threads
 and channels for the agent.
 """
 
+import asyncio
 import logging
+import time
+import weakref
+from collections import OrderedDict
 from typing import Any
 
 from src.interfaces.slack.slack_api import _slack_api_with_retry
@@ -15,6 +19,72 @@ logger = logging.getLogger(__name__)
 THREAD_CONTEXT_LIMIT = 20
 CHANNEL_CONTEXT_LIMIT = 10
 
+# Short-lived cache of raw Slack history so back-to-back events in the same
+# thread (or on the same channel message) share one API call
+CONTEXT_CACHE_TTL = 15.0
+CONTEXT_CACHE_MAX = 512
+
+_context_cache: OrderedDict[tuple[str, str, str], tuple[float, list[dict]]] = (
+    OrderedDict()
+)
+_context_locks: weakref.WeakValueDictionary[tuple[str, str, str], asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+async def _cached_history(
+    key: tuple[str, str, str], fetch: Any, **kwargs: Any
+) -> list[dict]:
+    """Return raw Slack messages for key, calling fetch on a cache miss.
+
+    Concurrent misses for the same key are coalesced into a single call.
+
+    Args:
+        key: Cache key (kind, channel, ts).
+        fetch: Slack client method to call.
+        **kwargs: Arguments for fetch.
+
+    Returns:
+        List of raw Slack message dicts.
+    """
+    lock = _context_locks.get(key)
+    if lock is None:
+        lock = _context_locks[key] = asyncio.Lock()
+
+    async with lock:
+        entry = _context_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < CONTEXT_CACHE_TTL:
+            _context_cache.move_to_end(key)
+            return entry[1]
+
+        result = await _slack_api_with_retry(fetch, **kwargs)
+        messages = result.get("messages", [])
+        _context_cache[key] = (time.monotonic(), messages)
+        _context_cache.move_to_end(key)
+        if len(_context_cache) > CONTEXT_CACHE_MAX:
+            _context_cache.popitem(last=False)
+        return messages
+
+
+def _is_bot(msg: dict[str, Any]) -> bool:
+    """Check whether a Slack message was posted by a bot."""
+    return bool(msg.get("bot_id")) or msg.get("subtype") == "bot_message"
+
+
+def invalidate_thread_context(channel: str, thread_ts: str) -> None:
+    """Drop cached history for a thread (e.g. after the bot replied to it).
+
+    Args:
+        channel: Channel ID.
+        thread_ts: Thread timestamp (parent message ts).
+    """
+    _context_cache.pop(("thread", channel, thread_ts), None)
+
+
+def clear_context_cache() -> None:
+    """Clear all cached thread and channel history."""
+    _context_cache.clear()
+
 
 async def _fetch_thread_context(
     client: Any,
@@ -34,25 +104,21 @@ async def _fetch_thread_context(
         List of messages with 'user' and 'text' keys, oldest first.
     """
     try:
-        result = await _slack_api_with_retry(
+        messages = await _cached_history(
+            ("thread", channel, thread_ts),
             client.conversations_replies,
             channel=channel,
             ts=thread_ts,
             limit=THREAD_CONTEXT_LIMIT,
         )
-        messages = result.get("messages", [])
-        context_messages = []
-        for msg in messages:
-            if msg.get("ts") == current_ts:
-                continue
-            is_bot = msg.get("bot_id") or msg.get("subtype") == "bot_message"
-            context_messages.append(
-                {
-                    "user": "assistant" if is_bot else msg.get("user", "unknown"),
-                    "text": msg.get("text", ""),
-                }
-            )
-        return context_messages
+        return [
+            {
+                "user": "assistant" if _is_bot(msg) else msg.get("user", "unknown"),
+                "text": msg.get("text", ""),
+            }
+            for msg in messages
+            if msg.get("ts") != current_ts
+        ]
     except Exception as e:
         logger.warning("Failed to fetch thread context: %s", e)
         return []
@@ -74,26 +140,20 @@ async def _fetch_channel_context(
         List of messages with 'user' and 'text' keys, oldest first.
     """
     try:
-        result = await _slack_api_with_retry(
+        messages = await _cached_history(
+            ("channel", channel, before_ts),
             client.conversations_history,
             channel=channel,
             latest=before_ts,
             limit=CHANNEL_CONTEXT_LIMIT,
             inclusive=False,
         )
-        messages_chronological = list(reversed(result.get("messages", [])))
-        context_messages = []
-        for msg in messages_chronological:
-            is_bot = msg.get("bot_id") or msg.get("subtype") == "bot_message"
-            if is_bot:
-                continue
-            context_messages.append(
-                {
-                    "user": msg.get("user", "unknown"),
-                    "text": msg.get("text", ""),
-                }
-            )
-        return context_messages
+        # History is newest first; walk it backwards for chronological order
+        return [
+            {"user": msg.get("user", "unknown"), "text": msg.get("text", "")}
+            for msg in reversed(messages)
+            if not _is_bot(msg)
+        ]
     except Exception as e:
         logger.warning("Failed to fetch channel context: %s", e)
         return []
@@ -116,15 +176,8 @@ def _format_context_for_agent(
         return ""
 
     context_type = "스레드" if is_thread else "채널"
-    lines = [f"[이전 {context_type} 대화 맥락]"]
-
-    for msg in context_messages:
-        user = msg["user"]
-        text = msg["text"]
-        if user == "assistant":
-            lines.append(f"봇: {text}")
-        else:
-            lines.append(f"사용자: {text}")
-
-    lines.append("[현재 요청]")
-    return "\n".join(lines) + "\n"
+    body = "\n".join(
+        ("봇: " if msg["user"] == "assistant" else "사용자: ") + msg["text"]
+        for msg in context_messages
+    )
+    return f"[이전 {context_type} 대화 맥락]\n{body}\n[현재 요청]\n"
@@ -12,15 +12,17 @@ Supports image uploads from MCP tools (e.g., Playwright screenshots).
 """
 
 import asyncio
+import base64
 import logging
+import re
 from collections.abc import Callable
 from typing import Any
 
 from src.config import settings
 from src.core.agent.core import AgentRunner, AgentRunResult
-from src.core.commands.executor import CommandExecutor
+from src.core.agent.pool import get_agent_runner_pool
+from src.core.commands.executor import get_command_executor
 from src.core.commands.parser import parse_command
-from src.core.commands.repository import get_repository
 from src.core.context import (
     cache_images_for_thread,
     clear_attached_images,
@@ -32,6 +34,7 @@ from src.interfaces.slack.context import (
     _fetch_channel_context,
     _fetch_thread_context,
     _format_context_for_agent,
+    invalidate_thread_context,
 )
 from src.interfaces.slack.images import (
     _extract_images_from_thread_history,
@@ -39,8 +42,12 @@ from src.interfaces.slack.images import (
     _upload_images_to_slack,
 )
 from src.interfaces.slack.progress import (
-    _format_progress,
+    PROCESSING_BLOCKS,
+    PROCESSING_TEXT,
+    THINKING_BLOCKS,
+    THINKING_TEXT,
     _muted_block,
+    _ProgressDebouncer,
 )
 from src.interfaces.slack.slack_api import (
     _send_multipart_message,
@@ -51,6 +58,9 @@ from src.utils.slack_files import process_slack_audio_files, process_slack_image
 
 logger = logging.getLogger(__name__)
 
+# @mention patterns like <@U123456>, with the whitespace that follows them
+_MENTION_RE = re.compile(r"<@[A-Z0-9]+>\s*")
+
 
 # Emoji to command mapping
 # When user reacts with these emojis, the mapped command is executed
@@ -75,8 +85,8 @@ async def _run_agent_with_progress(
     Uses AgentRunner.run_async_with_user() which is native async.
     Updates Slack message when tools are being used.
 
-    Shields the agent run from external cancellation to prevent MCP cleanup
-    issues when running in Slack's lazy listener context.
+    Runs the agent in its own task to prevent MCP cleanup issues when
+    running in Slack's lazy listener context.
 
     Args:
         runner: Shared AgentRunner instance.
@@ -94,39 +104,27 @@ async def _run_agent_with_progress(
             client.chat_update,
             channel=channel,
             ts=progress_ts,
-            text=":brain: 생각 중",
-            blocks=_muted_block(":brain: 생각 중"),
+            text=THINKING_TEXT,
+            blocks=THINKING_BLOCKS,
         )
     except (TimeoutError, asyncio.CancelledError):
         pass
 
-    async def on_tool_call(tool_name: str) -> None:
-        """Update progress message when a tool is called."""
-        text, blocks = _format_progress(tool_name)
-        try:
-            await _slack_api_with_retry(
-                client.chat_update,
-                channel=channel,
-                ts=progress_ts,
-                text=text,
-                blocks=blocks,
-            )
-        except (TimeoutError, asyncio.CancelledError):
-            pass
+    # Tool calls often come in bursts; coalesce their progress updates
+    on_tool_call = _ProgressDebouncer(client, channel, progress_ts)
 
     # Run in isolated task to prevent MCP cancel scope issues
-    # (Slack lazy listener runs in different task context than ack handler)
-    async def _isolated_run() -> AgentRunResult:
-        return await runner.run_async_with_user(
+    # (Slack lazy listener runs in different task context than ack handler).
+    # Awaiting the task directly still cancels it if this handler is cancelled.
+    task = asyncio.create_task(
+        runner.run_async_with_user(
             message, user_id, platform="slack", on_tool_call=on_tool_call
         )
-
-    task = asyncio.create_task(_isolated_run())
+    )
     try:
-        return await asyncio.shield(task)
-    except asyncio.CancelledError:
-        task.cancel()
-        raise
+        return await task
+    finally:
+        on_tool_call.cancel()
 
 
 def _create_agent_runner(user_id: str) -> AgentRunner:
@@ -159,11 +157,38 @@ def _extract_user_message(text: str) -> str:
     Returns:
         Cleaned user message without @mention.
     """
-    import re
+    cleaned = _MENTION_RE.sub("", text).strip()
+    return cleaned or text
+
+
+def _thread_key(channel: str, thread_ts: str) -> str:
+    """Build the key identifying a thread in the image caches.
+
+    Args:
+        channel: Channel ID.
+        thread_ts: Thread timestamp.
+
+    Returns:
+        Thread cache key.
+    """
+    return f"{channel}:{thread_ts}"
+
+
+def _settled(result: Any, what: str, default: Any) -> Any:
+    """Unwrap a result from asyncio.gather(..., return_exceptions=True).
 
-    # Remove @mention patterns like <@U123456>
-    cleaned = re.sub(r"<@[A-Z0-9]+>", "", text).strip()
-    return cleaned if cleaned else text
+    Args:
+        result: Value or exception returned by gather.
+        what: Description of the operation for logging.
+        default: Value to use when the operation failed.
+
+    Returns:
+        The result, or default if it was an exception.
+    """
+    if isinstance(result, BaseException):
+        logger.warning("Failed %s: %s", what, result)
+        return default
+    return result
 
 
 async def _process_user_message(
@@ -195,43 +220,57 @@ async def _process_user_message(
     progress_ts = None
 
     try:
+        cmd_prompt = None
         parsed_cmd = parse_command(user_message)
         if parsed_cmd:
-            executor = CommandExecutor(get_repository())
-            cmd_prompt = executor.execute(parsed_cmd, user_id=f"slack:{user_id}")
+            cmd_prompt = get_command_executor().execute(
+                parsed_cmd, user_id=f"slack:{user_id}"
+            )
             if cmd_prompt:
                 user_message = cmd_prompt
 
         is_in_thread = thread_ts != event_ts
-        if is_in_thread:
-            context_messages = await _fetch_thread_context(
-                client, channel, thread_ts, event_ts
-            )
-        else:
-            context_messages = await _fetch_channel_context(client, channel, event_ts)
-
-        context_prefix = _format_context_for_agent(context_messages, is_in_thread)
+        thread_key = _thread_key(channel, thread_ts)
+
+        # Context and attachments are independent Slack round-trips, so issue
+        # them together instead of one after another
+        fetches = []
+        # Command prompts are self-contained, so skip the conversation context
+        needs_context = cmd_prompt is None
+        if needs_context:
+            if is_in_thread:
+                fetches.append(
+                    _fetch_thread_context(client, channel, thread_ts, event_ts)
+                )
+            else:
+                fetches.append(_fetch_channel_context(client, channel, event_ts))
+        files = event.get("files") if event and settings.slack_bot_token else None
+        if files:
+            fetches.append(process_slack_images(files, settings.slack_bot_token))
+            fetches.append(process_slack_audio_files(files, settings.slack_bot_token))
+        pending = iter(await asyncio.gather(*fetches, return_exceptions=True))
+
+        context_messages: list[dict[str, str]] = []
+        context_prefix = ""
+        if needs_context:
+            context_messages = _settled(next(pending), "context fetch", [])
+            context_prefix = _format_context_for_agent(context_messages, is_in_thread)
 
         # Process attached files (images and audio)
         image_context = ""
         audio_context = ""
         processed_images: list[dict[str, Any]] = []
 
-        if event and event.get("files") and settings.slack_bot_token:
-            # Process images
-            processed_images = await process_slack_images(
-                event["files"], settings.slack_bot_token
-            )
+        if files:
+            processed_images = _settled(next(pending), "image processing", [])
             if processed_images:
                 # Store images in context for tools to access
                 set_attached_images(processed_images)
                 image_context = _format_images_for_agent(processed_images)
                 logger.info(f"Processed {len(processed_images)} image(s) from event")
 
-            # Process audio files (transcribe to text instead of passing binary)
-            audio_transcriptions = await process_slack_audio_files(
-                event["files"], settings.slack_bot_token
-            )
+            # Audio files are transcribed to text instead of passing binary
+            audio_transcriptions = _settled(next(pending), "audio transcription", [])
             if audio_transcriptions:
                 audio_lines = ["\n[첨부된 오디오 파일 전사 결과]"]
                 for t in audio_transcriptions:
@@ -245,7 +284,6 @@ async def _process_user_message(
 
         # If no direct attachments, check thread cache for previously generated images
         if not processed_images and is_in_thread:
-            thread_key = f"{channel}:{thread_ts}"
             cached_images = get_cached_images_for_thread(thread_key)
             if cached_images:
                 set_attached_images(cached_images)
@@ -257,63 +295,68 @@ async def _process_user_message(
                 # Fallback: try to extract from thread history (for old data URI format)
                 history_images = _extract_images_from_thread_history(context_messages)
                 if history_images:
+                    # Cache so later turns skip re-decoding the thread history
+                    cache_images_for_thread(thread_key, history_images)
                     set_attached_images(history_images)
                     image_context = _format_images_for_agent(history_images)
                     logger.info(
                         f"Extracted {len(history_images)} image(s) from thread history for editing"
                     )
 
-        message_with_context = (
-            context_prefix + user_message + image_context + audio_context
+        message_with_context = "".join(
+            (context_prefix, user_message, image_context, audio_context)
         )
 
         logger.info(
             "Processing %s from %s: %s", event_type, user_id, user_message[:100]
         )
 
+        # Posted only after the context fetch so the history read never
+        # includes the bot's own progress message
         progress_msg = await client.chat_postMessage(
             channel=channel,
             thread_ts=thread_ts,
-            text=":hourglass: 처리 중",
-            blocks=_muted_block(":hourglass: 처리 중"),
+            text=PROCESSING_TEXT,
+            blocks=PROCESSING_BLOCKS,
         )
         progress_ts = progress_msg.get("ts")
 
         set_scheduler_context(
             user_id=f"slack:{user_id}",
-            channel_id=str(channel),
+            channel_id=channel,
             thread_ts=thread_ts,
         )
 
-        runner = _create_agent_runner(user_id)
-        agent_result = await _run_agent_with_progress(
-            runner,
-            message_with_context,
-            client,
-            str(channel),
-            str(progress_ts),
-            user_id,
-        )
+        # Reuse this user's runner (and its MCP servers) across messages
+        async with get_agent_runner_pool().acquire(
+            user_id, lambda: _create_agent_runner(user_id)
+        ) as runner:
+            agent_result = await _run_agent_with_progress(
+                runner,
+                message_with_context,
+                client,
+                channel,
+                str(progress_ts),
+                user_id,
+            )
 
         response_text = agent_result.output if agent_result.output else "결과 없음"
         await _send_multipart_message(
-            client, str(channel), thread_ts, response_text, update_first_ts=progress_ts
+            client, channel, thread_ts, response_text, update_first_ts=progress_ts
         )
+        invalidate_thread_context(channel, thread_ts)
 
         if agent_result.images:
             await _upload_images_to_slack(
-                agent_result.images, client, str(channel), thread_ts
+                agent_result.images, client, channel, thread_ts
             )
             # Cache images for potential cross-message editing
-            thread_key = f"{channel}:{thread_ts}"
             cache_data = []
             for img in agent_result.images:
-                data_uri = img.to_data_uri()
-                b64_part = data_uri.split(",", 1)[1] if "," in data_uri else ""
                 cache_data.append(
                     {
                         "bytes": img.data,
-                        "base64": b64_part,
+                        "base64": base64.b64encode(img.data).decode("ascii"),
                         "mime_type": img.mime_type,
                         "name": img.filename
                         or f"generated_{len(cache_data)}.{img.extension}",
@@ -369,14 +412,14 @@ async def process_mention(event: dict[str, Any], say: Callable, client: Any) ->
     """Process app_mention event with real-time progress updates."""
     event_ts = event["ts"]
     thread_ts = event.get("thread_ts") or event_ts
-    channel = event.get("channel")
+    channel = event["channel"]
     user_id = event.get("user", "unknown")
     user_message = _extract_user_message(event.get("text", ""))
 
     await _process_user_message(
         user_message=user_message,
         user_id=user_id,
-        channel=str(channel),
+        channel=channel,
         thread_ts=thread_ts,
         event_ts=event_ts,
         client=client,
@@ -407,14 +450,14 @@ async def process_dm(event: dict[str, Any], say: Callable, client: Any) -> None:
 
     event_ts = event["ts"]
     thread_ts = event.get("thread_ts") or event_ts
-    channel = event.get("channel")
+    channel = event["channel"]
     user_id = event.get("user", "unknown")
     user_message = event.get("text", "")
 
     await _process_user_message(
         user_message=user_message,
         user_id=user_id,
-        channel=str(channel),
+        channel=channel,
         thread_ts=thread_ts,
         event_ts=event_ts,
         client=client,
@@ -502,7 +545,7 @@ async def process_reaction(event: dict[str, Any], say: Callable, client: Any) ->
     await _process_user_message(
         user_message=user_message,
         user_id=user_id,
-        channel=str(channel),
+        channel=channel,
         thread_ts=thread_ts,
         event_ts=message_ts,
         client=client,
@@ -7,11 +7,14 @@ Provides functions for:
 - Uploading images to Slack
 """
 
+import asyncio
+import base64
+import binascii
 import logging
 from typing import Any
 
 from src.interfaces.slack.slack_api import _slack_api_with_retry
-from src.utils.image_handler import ImageData, extract_data_uri_images
+from src.utils.image_handler import DATA_URI_RE, ImageData
 
 logger = logging.getLogger(__name__)
 
@@ -36,20 +39,25 @@ def _extract_images_from_thread_history(
             continue
 
         text = msg.get("text", "")
-        if "data:image/" not in text or ";base64," not in text:
+        if "data:image/" not in text:
             continue
 
-        # Extract data URI images from the bot's message
-        extracted = extract_data_uri_images(text)
-        for idx, img_data in enumerate(extracted):
+        # Extract data URI images from the bot's message, keeping the matched
+        # base64 text as-is instead of re-encoding the decoded bytes
+        for match in DATA_URI_RE.finditer(text):
+            mime_type, b64_data = match.groups()
+            try:
+                image_bytes = base64.b64decode(b64_data)
+            except (binascii.Error, ValueError) as e:
+                logger.warning("Failed to decode data URI image: %s", e)
+                continue
+            extension = mime_type.split("/")[-1]
             images.append(
                 {
-                    "bytes": img_data.data,
-                    "base64": img_data.to_data_uri().split(",", 1)[1]
-                    if "," in img_data.to_data_uri()
-                    else "",
-                    "mime_type": img_data.mime_type,
-                    "name": f"previous_generated_{len(images)}.{img_data.extension}",
+                    "bytes": image_bytes,
+                    "base64": b64_data,
+                    "mime_type": mime_type,
+                    "name": f"previous_generated_{len(images)}.{extension}",
                 }
             )
 
@@ -60,6 +68,20 @@ def _extract_images_from_thread_history(
     return images
 
 
+def _format_size(byte_size: int) -> str:
+    """Format a byte count as KB/MB with one (truncated) decimal place.
+
+    Args:
+        byte_size: Size in bytes.
+
+    Returns:
+        Size string such as "12.3KB" or "1.5MB".
+    """
+    if byte_size < 1 << 20:
+        return f"{byte_size >> 10}.{(byte_size & 1023) * 10 >> 10}KB"
+    return f"{byte_size >> 20}.{(byte_size & 0xFFFFF) * 10 >> 20}MB"
+
+
 def _format_images_for_agent(images: list[dict[str, Any]]) -> str:
     """Format image data description for the agent.
 
@@ -79,13 +101,8 @@ def _format_images_for_agent(images: list[dict[str, Any]]) -> str:
     for i, img in enumerate(images):
         name = img.get("name", f"image_{i}")
         mime_type = img.get("mime_type", "image/png")
-        byte_size = len(img.get("bytes", b"")) if img.get("bytes") else 0
-
-        size_str = (
-            f"{byte_size / 1024:.1f}KB"
-            if byte_size < 1024 * 1024
-            else f"{byte_size / (1024 * 1024):.1f}MB"
-        )
+        data = img.get("bytes")
+        size_str = _format_size(len(data) if data else 0)
         lines.append(f"- 이미지 {i} ({name}, {mime_type}, {size_str})")
 
     lines.append(
@@ -102,11 +119,18 @@ async def _upload_images_to_slack(
     channel: str,
     thread_ts: str,
 ) -> None:
-    """Upload images to Slack thread using files_upload_v2."""
-    for idx, image in enumerate(images):
-        try:
-            filename = image.filename or f"screenshot_{idx}.{image.extension}"
-            await _slack_api_with_retry(
+    """Upload images to Slack thread using files_upload_v2.
+
+    Uploads run concurrently; a failed upload is logged without affecting
+    the others.
+    """
+    filenames = [
+        image.filename or f"screenshot_{idx}.{image.extension}"
+        for idx, image in enumerate(images)
+    ]
+    results = await asyncio.gather(
+        *(
+            _slack_api_with_retry(
                 client.files_upload_v2,
                 channel=channel,
                 thread_ts=thread_ts,
@@ -114,6 +138,13 @@ async def _upload_images_to_slack(
                 filename=filename,
                 title=f"Screenshot {idx + 1}" if len(images) > 1 else "Screenshot",
             )
+            for idx, (image, filename) in enumerate(zip(images, filenames, strict=True))
+        ),
+        return_exceptions=True,
+    )
+    for idx, (filename, result) in enumerate(zip(filenames, results, strict=True)):
+        # Cancelled uploads come back as CancelledError, a BaseException
+        if isinstance(result, BaseException):
+            logger.warning("Failed to upload image %d: %s", idx, result)
+        else:
             logger.info("Uploaded image %s to channel %s", filename, channel)
-        except Exception as e:
-            logger.warning("Failed to upload image %d: %s", idx, e)
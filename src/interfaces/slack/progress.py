@@ -5,6 +5,19 @@ Provides emoji mappings and formatting functions for displaying tool progress
 and status updates in Slack messages.
 """
 
+import asyncio
+import logging
+import re
+from functools import lru_cache
+from typing import Any
+
+from src.interfaces.slack.slack_api import _slack_api_with_retry
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between tool progress updates of one message
+PROGRESS_UPDATE_INTERVAL = 0.5
+
 TOOL_EMOJI = {
     "fetch": ":globe_with_meridians:",
     "search": ":mag:",
@@ -17,7 +30,14 @@ TOOL_EMOJI = {
     "memory": ":brain:",
 }
 
+# All TOOL_EMOJI keys in one pattern, so a tool name is scanned once however
+# many keys there are. The lookahead also reports overlapping matches.
+_TOOL_EMOJI_RE = re.compile("(?=(" + "|".join(map(re.escape, TOOL_EMOJI)) + "))")
+# Earlier TOOL_EMOJI entries win when several keys match
+_TOOL_EMOJI_PRIORITY = {key: i for i, key in enumerate(TOOL_EMOJI)}
+
 
+@lru_cache(maxsize=128)
 def _get_tool_emoji(tool_name: str) -> str:
     """Get emoji for a tool name.
 
@@ -27,11 +47,10 @@ def _get_tool_emoji(tool_name: str) -> str:
     Returns:
         Slack emoji code for the tool, or :gear: as default.
     """
-    tool_lower = tool_name.lower()
-    for key, emoji in TOOL_EMOJI.items():
-        if key in tool_lower:
-            return emoji
-    return ":gear:"
+    matches = _TOOL_EMOJI_RE.findall(tool_name.lower())
+    if not matches:
+        return ":gear:"
+    return TOOL_EMOJI[min(matches, key=_TOOL_EMOJI_PRIORITY.__getitem__)]
 
 
 def _muted_block(text: str) -> list[dict]:
@@ -46,9 +65,20 @@ def _muted_block(text: str) -> list[dict]:
     return [{"type": "context", "elements": [{"type": "mrkdwn", "text": text}]}]
 
 
+# Static status messages, built once
+THINKING_TEXT = ":brain: 생각 중"
+THINKING_BLOCKS = _muted_block(THINKING_TEXT)
+PROCESSING_TEXT = ":hourglass: 처리 중"
+PROCESSING_BLOCKS = _muted_block(PROCESSING_TEXT)
+
+
+@lru_cache(maxsize=256)
 def _format_progress(tool_name: str) -> tuple[str, list[dict]]:
     """Return (fallback_text, blocks) for tool progress.
 
+    Results are cached per tool name and shared between calls, so callers
+    must not modify the returned blocks.
+
     Args:
         tool_name: Name of the tool being executed.
 
@@ -58,3 +88,70 @@ def _format_progress(tool_name: str) -> tuple[str, list[dict]]:
     emoji = _get_tool_emoji(tool_name)
     text = f"{emoji} {tool_name}"
     return text, _muted_block(text)
+
+
+class _ProgressDebouncer:
+    """Coalesce tool progress updates into one chat_update per interval.
+
+    Agents often call several tools within a second; chat.update is rate
+    limited, so only the latest tool seen at the end of each interval is
+    shown. Use as the on_tool_call callback and cancel() once the run ends
+    so a late update cannot overwrite the final response.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        channel: str,
+        progress_ts: str,
+        interval: float = PROGRESS_UPDATE_INTERVAL,
+    ) -> None:
+        """Initialize the debouncer.
+
+        Args:
+            client: Slack client for API calls.
+            channel: Channel ID.
+            progress_ts: Timestamp of progress message to update.
+            interval: Minimum seconds between updates.
+        """
+        self.client = client
+        self.channel = channel
+        self.progress_ts = progress_ts
+        self.interval = interval
+        self._latest: str | None = None
+        self._shown: str | None = None
+        self._task: asyncio.Task | None = None
+
+    async def __call__(self, tool_name: str) -> None:
+        """Record a tool call, scheduling an update if none is pending."""
+        self._latest = tool_name
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        """Show the latest tool after each interval until nothing changed."""
+        while True:
+            await asyncio.sleep(self.interval)
+            tool_name = self._latest
+            if tool_name is None or tool_name == self._shown:
+                return
+            text, blocks = _format_progress(tool_name)
+            try:
+                await _slack_api_with_retry(
+                    self.client.chat_update,
+                    channel=self.channel,
+                    ts=self.progress_ts,
+                    text=text,
+                    blocks=blocks,
+                )
+            except TimeoutError:
+                pass
+            except Exception as e:
+                # Nothing awaits this task, so an escaping error would go unseen
+                logger.warning("Failed to update tool progress: %s", e)
+            self._shown = tool_name
+
+    def cancel(self) -> None:
+        """Drop any pending update."""
+        if self._task is not None:
+            self._task.cancel()
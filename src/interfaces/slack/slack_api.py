@@ -2,26 +2,59 @@
 """Slack API utilities for message handling and retry logic."""
 
 import asyncio
+import random
+import re
 from collections.abc import Callable
 from typing import Any
 
+from slack_sdk.errors import SlackApiError
+
 from src.utils.slack_formatter import markdown_to_mrkdwn
 
 MAX_RETRIES = 3
-RETRY_DELAYS = [1, 2, 4]
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
 SLACK_MESSAGE_LIMIT = 2500
+MULTIPART_CONCURRENCY = 4
+
+_WHITESPACE_RE = re.compile(r"\s*")
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based attempt."""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt)
+    return delay * (0.5 + random.random() * 0.5)
+
+
+def _retry_after(error: SlackApiError) -> float | None:
+    """Get the Retry-After seconds Slack sent with an error, if any."""
+    headers = getattr(error.response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After") or headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
 
 
 async def _slack_api_with_retry(coro_func: Callable, *args, **kwargs) -> Any:
-    """Execute Slack API call with retry on timeout."""
+    """Execute Slack API call with retry on timeout or rate limiting.
+
+    Timeouts back off exponentially with jitter so concurrent callers do not
+    retry in lockstep. Rate-limited calls wait for Slack's Retry-After.
+    """
     last_error: BaseException = TimeoutError("Max retries exceeded")
     for attempt in range(MAX_RETRIES):
         try:
             return await coro_func(*args, **kwargs)
         except (TimeoutError, asyncio.TimeoutError, asyncio.CancelledError) as e:
             last_error = e
-            if attempt < MAX_RETRIES - 1:
-                await asyncio.sleep(RETRY_DELAYS[attempt])
+            delay = _retry_delay(attempt)
+        except SlackApiError as e:
+            if e.response.get("error") != "ratelimited":
+                raise
+            last_error = e
+            delay = _retry_after(e) or _retry_delay(attempt)
+        if attempt < MAX_RETRIES - 1:
+            await asyncio.sleep(delay)
     raise last_error
 
 
@@ -44,28 +77,77 @@ def _split_message_at_boundaries(
         return [text]
 
     chunks = []
-    remaining = text
+    start = 0
+    length = len(text)
 
-    while remaining:
-        if len(remaining) <= limit:
-            chunks.append(remaining)
+    while start < length:
+        if length - start <= limit:
+            chunks.append(text[start:])
             break
 
-        chunk = remaining[:limit]
-        split_at = chunk.rfind("\n\n")
+        # Bounded rfind searches the window in place without slicing it out;
+        # a miss (-1) gives a negative offset, which fails every threshold
+        end = start + limit
+        split_at = text.rfind("\n\n", start, end) - start
         if split_at < limit * 0.5:
-            split_at = chunk.rfind("\n")
+            split_at = text.rfind("\n", start, end) - start
         if split_at < limit * 0.3:
-            split_at = chunk.rfind(" ")
+            split_at = text.rfind(" ", start, end) - start
         if split_at < limit * 0.3:
             split_at = limit
 
-        chunks.append(remaining[:split_at].rstrip())
-        remaining = remaining[split_at:].lstrip()
+        # Trim the whitespace around the split point by index so each chunk
+        # is materialized with a single slice
+        stop = start + split_at
+        while stop > start and text[stop - 1].isspace():
+            stop -= 1
+        chunks.append(text[start:stop])
+        start = _WHITESPACE_RE.match(text, start + split_at).end()
 
     return chunks
 
 
+async def _post_chunk(
+    client: Any,
+    channel: str,
+    thread_ts: str,
+    chunk: str,
+    text: str,
+    update_ts: str | None = None,
+) -> None:
+    """Post one message part, or update update_ts with it.
+
+    If Slack rejects the part as too long, the chunk is re-split into
+    smaller pieces that are sent in order (without the part indicator).
+
+    Args:
+        client: Slack AsyncWebClient instance.
+        channel: Target channel ID.
+        thread_ts: Thread timestamp for replies.
+        chunk: Message part as split from the full text.
+        text: Text to send for the part (chunk plus part indicator).
+        update_ts: If provided, update this message instead of posting new.
+    """
+    try:
+        if update_ts:
+            await client.chat_update(channel=channel, ts=update_ts, text=text)
+        else:
+            await client.chat_postMessage(
+                channel=channel, thread_ts=thread_ts, text=text
+            )
+    except SlackApiError as e:
+        if e.response.get("error") != "msg_too_long":
+            raise
+        shorter = _split_message_at_boundaries(chunk, limit=1000)
+        for j, sub in enumerate(shorter):
+            if j == 0 and update_ts:
+                await client.chat_update(channel=channel, ts=update_ts, text=sub)
+            else:
+                await client.chat_postMessage(
+                    channel=channel, thread_ts=thread_ts, text=sub
+                )
+
+
 async def _send_multipart_message(
     client: Any,
     channel: str,
@@ -77,6 +159,9 @@ async def _send_multipart_message(
 
     Converts Markdown to Slack mrkdwn format and handles messages that
     exceed Slack's character limit by splitting at natural boundaries.
+    The first part is sent on its own; the remaining parts are posted
+    concurrently (at most MULTIPART_CONCURRENCY at a time), each labelled
+    with its part indicator.
 
     Args:
         client: Slack AsyncWebClient instance.
@@ -85,38 +170,37 @@ async def _send_multipart_message(
         text: Message text (Markdown format).
         update_first_ts: If provided, update existing message instead of posting new.
     """
-    from slack_sdk.errors import SlackApiError
-
     # Convert standard Markdown to Slack mrkdwn format
     converted_text = markdown_to_mrkdwn(text)
     chunks = _split_message_at_boundaries(converted_text)
-
-    for i, chunk in enumerate(chunks):
-        try:
-            if i == 0 and update_first_ts:
-                await client.chat_update(
-                    channel=channel, ts=update_first_ts, text=chunk
-                )
-            else:
-                part_indicator = f"({i + 1}/{len(chunks)})" if len(chunks) > 1 else ""
-                await client.chat_postMessage(
-                    channel=channel,
-                    thread_ts=thread_ts,
-                    text=f"{chunk}\n{part_indicator}".strip()
-                    if part_indicator
-                    else chunk,
-                )
-        except SlackApiError as e:
-            if e.response.get("error") == "msg_too_long":
-                shorter = _split_message_at_boundaries(chunk, limit=1000)
-                for j, sub in enumerate(shorter):
-                    if i == 0 and j == 0 and update_first_ts:
-                        await client.chat_update(
-                            channel=channel, ts=update_first_ts, text=sub
-                        )
-                    else:
-                        await client.chat_postMessage(
-                            channel=channel, thread_ts=thread_ts, text=sub
-                        )
-            else:
-                raise
+    total = len(chunks)
+
+    first = chunks[0]
+    if update_first_ts or total == 1:
+        first_text = first
+    else:
+        first_text = f"{first}\n(1/{total})".strip()
+    await _post_chunk(
+        client, channel, thread_ts, first, first_text, update_ts=update_first_ts
+    )
+    if total == 1:
+        return
+
+    semaphore = asyncio.Semaphore(MULTIPART_CONCURRENCY)
+
+    async def post(chunk: str, text: str) -> None:
+        async with semaphore:
+            await _post_chunk(client, channel, thread_ts, chunk, text)
+
+    # Later chunks start after the skipped whitespace and the indicator ends
+    # the text, so plain concatenation needs no strip()
+    results = await asyncio.gather(
+        *(
+            post(chunk, f"{chunk}\n({i}/{total})")
+            for i, chunk in enumerate(chunks[1:], start=2)
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
@@ -20,28 +20,157 @@ Example:
 
 import fnmatch
 import logging
+import re
+from collections import OrderedDict
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from pydantic_ai import RunContext
 from pydantic_ai.mcp import CallToolFunc, ToolResult
 
+from src.tools.mcp_registry import (
+    get_all_guardrail_rules,
+    get_base_tool_name,
+    get_registry_version,
+)
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of allowed tool calls remembered per config
+ALLOWED_CALL_CACHE_MAX = 256
+# String arguments longer than this (e.g. file contents) disable caching
+_MAX_CACHED_ARG_LEN = 1024
+
+# Common parameter names for file paths (compared lowercased)
+_PATH_PARAMS = frozenset(
+    {
+        "path",
+        "file",
+        "filepath",
+        "file_path",
+        "filename",
+        "source",
+        "destination",
+        "src",
+        "dst",
+        "paths",
+    }
+)
+_LOOKS_LIKE_PATH = re.compile(r"[/\\.]")
+
 
 # ============================================================================
 # Guardrail Configuration
 # ============================================================================
 
 
-@dataclass
+@lru_cache(maxsize=64)
+def _compile_globs(patterns: frozenset[str]) -> re.Pattern[str] | None:
+    """Compile glob patterns into a single alternation of their lowercased forms.
+
+    Cached, so configs created per request share the compiled regex.
+
+    Args:
+        patterns: fnmatch-style glob patterns.
+
+    Returns:
+        Compiled regex matching lowercased input, or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(p.lower())})" for p in sorted(patterns))
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_literals(literals: frozenset[str]) -> re.Pattern[str] | None:
+    """Compile literal substrings into a single alternation for one-pass search.
+
+    Cached, so configs created per request share the compiled regex.
+
+    Args:
+        literals: Substrings to search for.
+
+    Returns:
+        Compiled regex, or None if there are no literals.
+    """
+    escaped = sorted({re.escape(literal) for literal in literals})
+    return re.compile("|".join(escaped)) if escaped else None
+
+
+@dataclass(frozen=True)
+class _ServerRules:
+    """Union of all registered servers' guardrail rules for one registry version."""
+
+    registry_version: int
+    write_tools: frozenset[str]
+    sensitive_file_patterns: frozenset[str]
+    sensitive_path_patterns: frozenset[str]
+    safe_file_patterns: frozenset[str]
+    custom_checks: tuple[Callable[[str, tuple, dict[str, Any], Any], None], ...]
+
+
+# Snapshot of the aggregated server rules, rebuilt when the registry changes
+_server_rules_snapshot: _ServerRules | None = None
+
+
+def _server_rules() -> _ServerRules:
+    """Get the aggregated guardrail rules of all registered MCP servers."""
+    global _server_rules_snapshot
+    snapshot = _server_rules_snapshot
+    if snapshot is not None and snapshot.registry_version == get_registry_version():
+        return snapshot
+
+    all_rules = get_all_guardrail_rules()
+    # Read the version after aggregating: the first aggregation may
+    # trigger server discovery, which registers servers
+    snapshot = _ServerRules(
+        registry_version=get_registry_version(),
+        write_tools=frozenset().union(*(r.write_tools for r in all_rules)),
+        sensitive_file_patterns=frozenset().union(
+            *(r.sensitive_file_patterns for r in all_rules)
+        ),
+        sensitive_path_patterns=frozenset().union(
+            *(r.sensitive_path_patterns for r in all_rules)
+        ),
+        safe_file_patterns=frozenset().union(
+            *(r.safe_file_patterns for r in all_rules)
+        ),
+        custom_checks=tuple(r.custom_check for r in all_rules if r.custom_check),
+    )
+    _server_rules_snapshot = snapshot
+    return snapshot
+
+
+@dataclass(frozen=True)
+class _CompiledRules:
+    """Aggregated guardrail patterns compiled for one registry version."""
+
+    registry_version: int
+    safe: re.Pattern[str] | None
+    sensitive: re.Pattern[str] | None
+    # Wildcard-free sensitive patterns, matched anywhere in the path
+    sensitive_literals: re.Pattern[str] | None
+    sensitive_paths: re.Pattern[str] | None
+    blocked_tools: frozenset[str]
+    # Normalized safe zones wrapped in slashes, e.g. "/data/"
+    safe_zones: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
 class GuardrailConfig:
     """Configuration for tool guardrails.
 
     Server-specific rules (write tools, sensitive patterns) are aggregated
     from registered MCP servers via ServerGuardrailRules.
 
+    The config is immutable so it can be shared between concurrent agents
+    and the rules compiled from it can be cached safely. Sets passed in
+    are stored as frozensets.
+
     Attributes:
         read_only: If True, block all write/modify/delete operations.
         block_sensitive_files: If True, block access to sensitive files.
@@ -56,50 +185,83 @@ class GuardrailConfig:
 
     read_only: bool = True
     block_sensitive_files: bool = True
-    sensitive_patterns: set[str] = field(default_factory=set)
-    safe_patterns: set[str] = field(default_factory=set)
-    blocked_tools: set[str] = field(default_factory=set)
-    allowed_tools: set[str] | None = None
+    sensitive_patterns: frozenset[str] = frozenset()
+    safe_patterns: frozenset[str] = frozenset()
+    blocked_tools: frozenset[str] = frozenset()
+    allowed_tools: frozenset[str] | None = None
     log_blocked_attempts: bool = True
     current_user_id: str | None = None
-    safe_zone_paths: set[str] = field(default_factory=lambda: {"data/"})
+    safe_zone_paths: frozenset[str] = frozenset({"data/"})
+    _compiled: _CompiledRules | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # call key -> registry version the call was allowed under, LRU order
+    _allowed_calls: OrderedDict[tuple, int] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
 
-    def get_all_sensitive_patterns(self) -> set[str]:
+    def __post_init__(self) -> None:
+        for name in (
+            "sensitive_patterns",
+            "safe_patterns",
+            "blocked_tools",
+            "safe_zone_paths",
+        ):
+            object.__setattr__(self, name, frozenset(getattr(self, name)))
+        if self.allowed_tools is not None:
+            object.__setattr__(self, "allowed_tools", frozenset(self.allowed_tools))
+
+    def get_all_sensitive_patterns(self) -> frozenset[str]:
         """Get all sensitive file patterns including custom and server-registered ones."""
-        from src.tools.mcp_registry import get_all_guardrail_rules
-
-        patterns = set(self.sensitive_patterns)
-        for rules in get_all_guardrail_rules():
-            patterns |= rules.sensitive_file_patterns
-        return patterns
+        return self.sensitive_patterns | _server_rules().sensitive_file_patterns
 
-    def get_all_sensitive_path_patterns(self) -> set[str]:
+    def get_all_sensitive_path_patterns(self) -> frozenset[str]:
         """Get all sensitive path patterns from server-registered rules."""
-        from src.tools.mcp_registry import get_all_guardrail_rules
-
-        patterns: set[str] = set()
-        for rules in get_all_guardrail_rules():
-            patterns |= rules.sensitive_path_patterns
-        return patterns
+        return _server_rules().sensitive_path_patterns
 
-    def get_all_safe_patterns(self) -> set[str]:
+    def get_all_safe_patterns(self) -> frozenset[str]:
         """Get all safe file patterns including custom and server-registered ones."""
-        from src.tools.mcp_registry import get_all_guardrail_rules
+        return self.safe_patterns | _server_rules().safe_file_patterns
 
-        patterns = set(self.safe_patterns)
-        for rules in get_all_guardrail_rules():
-            patterns |= rules.safe_file_patterns
-        return patterns
-
-    def get_all_blocked_tools(self) -> set[str]:
+    def get_all_blocked_tools(self) -> frozenset[str]:
         """Get all blocked tool names."""
-        from src.tools.mcp_registry import get_all_guardrail_rules
-
-        blocked = self.blocked_tools.copy()
         if self.read_only:
-            for rules in get_all_guardrail_rules():
-                blocked |= rules.write_tools
-        return blocked
+            return self.blocked_tools | _server_rules().write_tools
+        return self.blocked_tools
+
+    def compiled_rules(self) -> _CompiledRules:
+        """Get the aggregated patterns compiled for matching.
+
+        Compiled lazily and rebuilt only when the MCP registry changes.
+        Patterns are lowercased, so match against lowercased input.
+        """
+        server_rules = _server_rules()
+        compiled = self._compiled
+        if (
+            compiled is not None
+            and compiled.registry_version == server_rules.registry_version
+        ):
+            return compiled
+
+        sensitive = self.get_all_sensitive_patterns()
+        blocked = self.get_all_blocked_tools()
+        compiled = _CompiledRules(
+            registry_version=server_rules.registry_version,
+            safe=_compile_globs(self.get_all_safe_patterns()),
+            sensitive=_compile_globs(sensitive),
+            sensitive_literals=_compile_literals(
+                frozenset(p.lower() for p in sensitive if "*" not in p)
+            ),
+            sensitive_paths=_compile_globs(self.get_all_sensitive_path_patterns()),
+            blocked_tools=frozenset(t.lower() for t in blocked),
+            safe_zones=tuple(
+                "/" + zone.lower().replace("\\", "/").rstrip("/") + "/"
+                for zone in self.safe_zone_paths
+            ),
+        )
+        # Frozen dataclass: the cache slot is set past the frozen __setattr__
+        object.__setattr__(self, "_compiled", compiled)
+        return compiled
 
     def get_allowed_memory_entity(self) -> str | None:
         """Get the allowed memory entity name for current user."""
@@ -140,33 +302,32 @@ def is_sensitive_file(path: str, config: GuardrailConfig) -> bool:
     """
     if not path:
         return False
+    return _matches_sensitive(_normalize_path(path), config.compiled_rules())
 
-    path_lower = path.lower().replace("\\", "/")
-    filename = path_lower.split("/")[-1]
+
+def _normalize_path(path: str) -> str:
+    """Lowercase a path and use forward slashes, as the compiled rules expect."""
+    return path.lower().replace("\\", "/")
+
+
+def _matches_sensitive(path_lower: str, rules: _CompiledRules) -> bool:
+    """Check a normalized, non-empty path against the compiled sensitive rules."""
+    filename = path_lower.rpartition("/")[2]
 
     # Check safe patterns first - they override sensitive patterns
-    for pattern in config.get_all_safe_patterns():
-        if fnmatch.fnmatch(filename, pattern.lower()):
-            return False
-        if fnmatch.fnmatch(path_lower, pattern.lower()):
-            return False
+    if rules.safe and (rules.safe.match(filename) or rules.safe.match(path_lower)):
+        return False
 
     # Check sensitive file patterns
-    for pattern in config.get_all_sensitive_patterns():
-        pattern_lower = pattern.lower()
-        if fnmatch.fnmatch(filename, pattern_lower):
-            return True
-        if fnmatch.fnmatch(path_lower, pattern_lower):
-            return True
-        if "*" not in pattern and pattern_lower in path_lower:
-            return True
+    if rules.sensitive and (
+        rules.sensitive.match(filename) or rules.sensitive.match(path_lower)
+    ):
+        return True
+    if rules.sensitive_literals and rules.sensitive_literals.search(path_lower):
+        return True
 
     # Check sensitive path patterns
-    for pattern in config.get_all_sensitive_path_patterns():
-        if fnmatch.fnmatch(path_lower, pattern.lower()):
-            return True
-
-    return False
+    return bool(rules.sensitive_paths and rules.sensitive_paths.match(path_lower))
 
 
 def is_in_safe_zone(path: str, config: GuardrailConfig) -> bool:
@@ -184,19 +345,15 @@ def is_in_safe_zone(path: str, config: GuardrailConfig) -> bool:
     """
     if not path or not config.safe_zone_paths:
         return False
+    return _in_safe_zone(_normalize_path(path), config.compiled_rules())
 
-    path_lower = path.lower().replace("\\", "/")
-
-    for zone in config.safe_zone_paths:
-        zone_lower = zone.lower().replace("\\", "/").rstrip("/") + "/"
-        # Direct match: data/file.txt starts with data/
-        if path_lower.startswith(zone_lower) or path_lower == zone_lower.rstrip("/"):
-            return True
-        # Absolute path: /path/to/project/data/file.txt contains /data/
-        if f"/{zone_lower}" in f"/{path_lower}/":
-            return True
 
-    return False
+def _in_safe_zone(path_lower: str, rules: _CompiledRules) -> bool:
+    """Check a normalized, non-empty path against the compiled safe zones."""
+    # Wrapping the path in slashes covers a relative prefix (data/file.txt),
+    # the zone itself (data) and absolute paths (/path/to/project/data/file.txt)
+    padded = f"/{path_lower}/"
+    return any(zone in padded for zone in rules.safe_zones)
 
 
 def extract_paths_from_args(args: tuple, kwargs: dict, tool_name: str) -> list[str]:
@@ -210,44 +367,46 @@ def extract_paths_from_args(args: tuple, kwargs: dict, tool_name: str) -> list[s
     Returns:
         List of file paths found in arguments.
     """
-    paths = []
+    paths: list[str] = []
+
+    # Check kwargs. Most tools take no path and use lowercase names: a C-level
+    # key intersection and islower() scan rule those out without the loop
+    if kwargs.keys() & _PATH_PARAMS or not all(map(str.islower, kwargs)):
+        for key, value in kwargs.items():
+            if key.lower() in _PATH_PARAMS:
+                if isinstance(value, str):
+                    paths.append(value)
+                elif isinstance(value, list):
+                    paths.extend(v for v in value if isinstance(v, str))
+
+    # Check positional args (usually the first arg is a path for file tools).
+    # Heuristic: a string containing a separator or a dot looks like a path
+    for arg in args:
+        items = arg if isinstance(arg, list) else (arg,)
+        paths.extend(
+            item
+            for item in items
+            if isinstance(item, str) and _LOOKS_LIKE_PATH.search(item)
+        )
 
-    # Common parameter names for file paths
-    path_params = {
-        "path",
-        "file",
-        "filepath",
-        "file_path",
-        "filename",
-        "source",
-        "destination",
-        "src",
-        "dst",
-        "paths",
-    }
+    return paths
 
-    # Check kwargs
-    for key, value in kwargs.items():
-        if key.lower() in path_params:
-            if isinstance(value, str):
-                paths.append(value)
-            elif isinstance(value, list):
-                paths.extend([v for v in value if isinstance(v, str)])
 
-    # Check positional args (usually the first arg is a path for file tools)
-    for arg in args:
-        if isinstance(arg, str):
-            # Heuristic: if it looks like a path, add it
-            if "/" in arg or "\\" in arg or "." in arg:
-                paths.append(arg)
-        elif isinstance(arg, list):
-            for item in arg:
-                if isinstance(item, str) and (
-                    "/" in item or "\\" in item or "." in item
-                ):
-                    paths.append(item)
+def _call_cache_key(tool_name: str, args: tuple, kwargs: dict) -> tuple | None:
+    """Build a hashable key for a tool call.
 
-    return paths
+    Returns:
+        Cache key, or None if the arguments are unhashable or too large to cache.
+    """
+    values = (*args, *kwargs.values())
+    if any(isinstance(v, str) and len(v) > _MAX_CACHED_ARG_LEN for v in values):
+        return None
+    key = (tool_name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 def check_guardrails(
@@ -259,6 +418,9 @@ def check_guardrails(
     """Check if a tool call violates any guardrails.
 
     Aggregates rules from all registered MCP servers and runs custom checks.
+    Allowed calls are remembered per config, so repeating an identical call
+    skips the checks until the MCP registry changes. Violations are never
+    cached and are re-checked (and logged) every time.
 
     Args:
         tool_name: Name of the tool being called (may be prefixed).
@@ -269,8 +431,31 @@ def check_guardrails(
     Raises:
         GuardrailViolation: If any guardrail is violated.
     """
-    from src.tools.mcp_registry import get_base_tool_name
+    key = _call_cache_key(tool_name, args, kwargs)
+    if key is None:
+        _check_guardrails_uncached(tool_name, args, kwargs, config)
+        return
+
+    allowed = config._allowed_calls
+    version = get_registry_version()
+    if allowed.get(key) == version:
+        allowed.move_to_end(key)
+        return
+
+    _check_guardrails_uncached(tool_name, args, kwargs, config)
+    allowed[key] = version
+    allowed.move_to_end(key)
+    while len(allowed) > ALLOWED_CALL_CACHE_MAX:
+        allowed.popitem(last=False)
 
+
+def _check_guardrails_uncached(
+    tool_name: str,
+    args: tuple,
+    kwargs: dict,
+    config: GuardrailConfig,
+) -> None:
+    """Run every guardrail check for a tool call (see check_guardrails)."""
     tool_name_lower = tool_name.lower()
     base_name_lower = get_base_tool_name(tool_name_lower)
 
@@ -283,13 +468,29 @@ def check_guardrails(
                 logger.warning("GUARDRAIL BLOCKED: %s", msg)
             raise GuardrailViolation(msg, tool_name, "not_allowed")
 
-    blocked_tools = config.get_all_blocked_tools()
-    blocked_lower = {t.lower() for t in blocked_tools}
-    if tool_name_lower in blocked_lower or base_name_lower in blocked_lower:
+    rules = config.compiled_rules()
+    is_blocked = (
+        tool_name_lower in rules.blocked_tools or base_name_lower in rules.blocked_tools
+    )
+    safe_zone_applies = is_blocked and config.read_only and config.safe_zone_paths
+
+    # Extract and normalize paths once for the safe zone and sensitive checks
+    paths = (
+        [
+            (p, _normalize_path(p))
+            for p in extract_paths_from_args(args, kwargs, tool_name)
+        ]
+        if safe_zone_applies or config.block_sensitive_files
+        else []
+    )
+
+    if is_blocked:
         # Check if write operation is allowed in safe zone
-        if config.read_only and config.safe_zone_paths:
-            paths = extract_paths_from_args(args, kwargs, tool_name)
-            if paths and all(is_in_safe_zone(p, config) for p in paths):
+        if safe_zone_applies:
+            if paths and all(
+                path_lower and _in_safe_zone(path_lower, rules)
+                for _, path_lower in paths
+            ):
                 pass  # Allow - continue to sensitive file check
             else:
                 violation_type = "write_operation"
@@ -310,20 +511,16 @@ def check_guardrails(
 
     # Check sensitive file access
     if config.block_sensitive_files:
-        paths = extract_paths_from_args(args, kwargs, tool_name)
-        for path in paths:
-            if is_sensitive_file(path, config):
+        for path, path_lower in paths:
+            if path_lower and _matches_sensitive(path_lower, rules):
                 msg = f"Access to sensitive file blocked: {path}"
                 if config.log_blocked_attempts:
                     logger.warning("GUARDRAIL BLOCKED: %s (tool: %s)", msg, tool_name)
                 raise GuardrailViolation(msg, tool_name, "sensitive_file")
 
     # Run custom guardrail checks from registered servers
-    from src.tools.mcp_registry import get_all_guardrail_rules
-
-    for rules in get_all_guardrail_rules():
-        if rules.custom_check:
-            rules.custom_check(tool_name, args, kwargs, config)
+    for custom_check in _server_rules().custom_checks:
+        custom_check(tool_name, args, kwargs, config)
 
 
 # ============================================================================
@@ -337,6 +534,17 @@ ProcessToolCallHook = Callable[
 ]
 
 
+def _is_permissive(config: GuardrailConfig) -> bool:
+    """Check whether a config can never block a tool call."""
+    return (
+        not config.read_only
+        and not config.block_sensitive_files
+        and not config.blocked_tools
+        and config.allowed_tools is None
+        and not _server_rules().custom_checks
+    )
+
+
 def create_guardrail_hook(
     config: GuardrailConfig | None = None,
 ) -> ProcessToolCallHook:
@@ -345,6 +553,7 @@ def create_guardrail_hook(
     This function creates an async hook compatible with pydantic-ai's
     MCPServerStdio process_tool_call parameter. The hook intercepts tool
     calls and applies security guardrails before forwarding to the actual tool.
+    For a config that cannot block anything the hook forwards calls directly.
 
     Args:
         config: Guardrail configuration. Defaults to read-only + block sensitive.
@@ -361,6 +570,18 @@ def create_guardrail_hook(
     """
     config = config or GuardrailConfig()
 
+    if _is_permissive(config):
+        # Nothing can be blocked, so skip the checks entirely
+        async def passthrough_hook(
+            ctx: RunContext,
+            call_tool: CallToolFunc,
+            name: str,
+            tool_args: dict[str, Any],
+        ) -> ToolResult:
+            return await call_tool(name, tool_args, None)
+
+        return passthrough_hook
+
     async def guardrail_hook(
         ctx: RunContext,
         call_tool: CallToolFunc,
@@ -373,7 +594,7 @@ def create_guardrail_hook(
             error_msg = f"[BLOCKED] {e}"
             if e.violation_type == "write_operation":
                 error_msg += (
-                    f"\n\nHINT: You can only write to safe zones: {config.safe_zone_paths}. "
+                    f"\n\nHINT: You can only write to safe zones: {set(config.safe_zone_paths)}. "
                     "Use paths like 'data/filename.txt' instead."
                 )
             elif e.violation_type == "sensitive_file":
@@ -86,22 +86,7 @@ class GuardrailEnforcer:
             ...     with open(path) as f:
             ...         return f.read()
         """
-        if inspect.iscoroutinefunction(func):
-
-            @functools.wraps(func)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                self.check(func.__name__, args, kwargs)
-                return await func(*args, **kwargs)
-
-            return async_wrapper  # type: ignore[return-value]
-        else:
-
-            @functools.wraps(func)
-            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                self.check(func.__name__, args, kwargs)
-                return func(*args, **kwargs)
-
-            return sync_wrapper  # type: ignore[return-value]
+        return self.wrap_tool_with_name(func.__name__)(func)
 
     def wrap_tool_with_name(self, tool_name: str) -> Callable[[F], F]:
         """Wrap a tool function with guardrail checks using a custom name.
@@ -123,12 +108,15 @@ class GuardrailEnforcer:
             ...         f.write(content)
         """
 
+        # Bind once so each wrapped call skips the attribute lookup on self
+        check = self.check
+
         def decorator(func: F) -> F:
             if inspect.iscoroutinefunction(func):
 
                 @functools.wraps(func)
                 async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                    self.check(tool_name, args, kwargs)
+                    check(tool_name, args, kwargs)
                     return await func(*args, **kwargs)
 
                 return async_wrapper  # type: ignore[return-value]
@@ -136,7 +124,7 @@ class GuardrailEnforcer:
 
                 @functools.wraps(func)
                 def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                    self.check(tool_name, args, kwargs)
+                    check(tool_name, args, kwargs)
                     return func(*args, **kwargs)
 
                 return sync_wrapper  # type: ignore[return-value]
@@ -1,7 +1,6 @@
 """Preprocessing middleware for message handling."""
 
-from src.core.commands import CommandExecutor, parse_command
-from src.core.commands.repository import get_repository
+from src.core.commands import get_command_executor, parse_command
 from src.core.context import clear_attached_images, set_attached_images
 from src.core.scheduler.tools import clear_scheduler_context, set_scheduler_context
 
@@ -13,8 +12,7 @@ def preprocess_command(message: str, user_id: str) -> str | None:
     """
     parsed_cmd = parse_command(message)
     if parsed_cmd:
-        executor = CommandExecutor(get_repository())
-        return executor.execute(parsed_cmd, user_id=user_id)
+        return get_command_executor().execute(parsed_cmd, user_id=user_id)
     return None
 
 
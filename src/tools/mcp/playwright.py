@@ -6,6 +6,10 @@ the Playwright MCP server and all related cleanup functionality.
 
 Server config:
     Registers the Playwright MCP server via register_mcp_server().
+    Set PLAYWRIGHT_MCP_BLOCK_RESOURCES=1 for text-only browsing: images are
+    disabled and ad/analytics origins are blocked, which speeds up page
+    loads but makes pages render differently. PLAYWRIGHT_MCP_BLOCK_PATTERNS
+    (comma-separated origins) replaces the default blocked origins.
 
 Cleanup utilities:
     PlaywrightCleanupTracker tracks browser open/close state and
@@ -20,13 +24,17 @@ Usage:
     await tracker.cleanup()
 """
 
-import glob
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import tempfile
+import time
 from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from src.tools.mcp_registry import ServerCleanupHooks, register_mcp_server
@@ -38,38 +46,87 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 # Playwright MCP tool names that indicate browser is open
-BROWSER_OPEN_TOOLS = {
-    "browser_navigate",
-    "browser_click",
-    "browser_type",
-    "browser_fill_form",
-    "browser_take_screenshot",
-    "browser_snapshot",
-    "browser_hover",
-    "browser_drag",
-    "browser_select_option",
-    "browser_press_key",
-    "browser_evaluate",
-    "browser_wait_for",
-    "browser_handle_dialog",
-    "browser_file_upload",
-    "browser_tabs",
-    "browser_navigate_back",
-    "browser_network_requests",
-    "browser_console_messages",
-    "browser_run_code",
-    "browser_resize",
-}
+BROWSER_OPEN_TOOLS = frozenset(
+    {
+        "browser_navigate",
+        "browser_click",
+        "browser_type",
+        "browser_fill_form",
+        "browser_take_screenshot",
+        "browser_snapshot",
+        "browser_hover",
+        "browser_drag",
+        "browser_select_option",
+        "browser_press_key",
+        "browser_evaluate",
+        "browser_wait_for",
+        "browser_handle_dialog",
+        "browser_file_upload",
+        "browser_tabs",
+        "browser_navigate_back",
+        "browser_network_requests",
+        "browser_console_messages",
+        "browser_run_code",
+        "browser_resize",
+    }
+)
 
 # Tool that closes the browser
 BROWSER_CLOSE_TOOL = "browser_close"
 
-# Screenshot patterns to clean up
-SCREENSHOT_PATTERNS = [
-    "screenshot_*.png",
-    "playwright_screenshot_*.png",
-    "browser_screenshot_*.png",
-]
+# Temp screenshot name prefixes to clean up (all with SCREENSHOT_SUFFIX)
+SCREENSHOT_PREFIXES = (
+    "screenshot_",
+    "playwright_screenshot_",
+    "browser_screenshot_",
+)
+SCREENSHOT_SUFFIX = ".png"
+
+# Tracked screenshots are deleted from a thread pool above this count
+PARALLEL_DELETE_THRESHOLD = 8
+MAX_DELETE_WORKERS = 16
+
+
+@lru_cache(maxsize=256)
+def _classify_tool(tool_name: str) -> tuple[bool, bool, bool]:
+    """Classify a tool name as (opens browser, closes browser, screenshot).
+
+    Tool names come from a small fixed vocabulary, so the prefix strip and
+    set lookups run once per distinct name.
+    """
+    # Strip any prefix (e.g., "playwright_browser_click" -> "browser_click")
+    if tool_name.startswith("playwright_"):
+        base_name = tool_name[11:]
+    elif tool_name.startswith("pw_"):
+        base_name = tool_name[3:]
+    else:
+        base_name = tool_name
+
+    return (
+        base_name in BROWSER_OPEN_TOOLS,
+        base_name == BROWSER_CLOSE_TOOL,
+        base_name == "browser_take_screenshot",
+    )
+
+
+def _delete_tracked_file(filepath: str) -> bool:
+    """Delete a tracked screenshot file.
+
+    Args:
+        filepath: Path of the screenshot to delete.
+
+    Returns:
+        True if the file was deleted.
+    """
+    try:
+        os.unlink(filepath)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        logger.warning("Failed to delete screenshot %s: %s", filepath, e)
+        return False
+    logger.debug("Deleted tracked screenshot: %s", filepath)
+    return True
 
 
 @dataclass
@@ -79,16 +136,18 @@ class PlaywrightCleanupTracker:
     Attributes:
         browser_opened: Whether any browser-opening tool was called.
         browser_closed: Whether browser_close was called.
-        screenshot_files: List of screenshot file paths to clean up.
+        screenshot_files: Set of screenshot file paths to clean up.
         temp_dir: Directory to scan for temporary screenshots.
     """
 
     browser_opened: bool = False
     browser_closed: bool = False
-    screenshot_files: list[str] = field(default_factory=list)
+    screenshot_files: set[str] = field(default_factory=set)
     temp_dir: str = field(default_factory=lambda: tempfile.gettempdir())
-    _session_start: datetime = field(default_factory=datetime.now)
+    _session_start: float = field(default_factory=time.time)
     _cleanup_done: bool = False
+    # Created on first cleanup() so construction needs no event loop
+    _cleanup_lock: asyncio.Lock | None = field(default=None, repr=False, compare=False)
 
     def track_tool_call(self, tool_name: str, args: dict[str, Any]) -> None:
         """Track a Playwright tool call.
@@ -97,26 +156,22 @@ class PlaywrightCleanupTracker:
             tool_name: Name of the tool being called.
             args: Arguments passed to the tool.
         """
-        # Strip any prefix (e.g., "playwright_browser_click" -> "browser_click")
-        base_name = tool_name
-        for prefix in ["playwright_", "pw_"]:
-            if base_name.startswith(prefix):
-                base_name = base_name[len(prefix) :]
-                break
+        is_open, is_close, is_screenshot = _classify_tool(tool_name)
 
-        if base_name in BROWSER_OPEN_TOOLS:
+        # Log only the first open; later calls would repeat it on every tool use
+        if is_open and not self.browser_opened:
             self.browser_opened = True
             logger.debug("Playwright browser opened via %s", tool_name)
 
-        if base_name == BROWSER_CLOSE_TOOL:
+        if is_close:
             self.browser_closed = True
             logger.debug("Playwright browser closed via %s", tool_name)
 
         # Track screenshot files if path is in args
-        if base_name == "browser_take_screenshot":
+        if is_screenshot:
             path = args.get("path")
             if path and isinstance(path, str):
-                self.screenshot_files.append(path)
+                self.screenshot_files.add(path)
                 logger.debug("Tracked screenshot file: %s", path)
 
     def create_hook(
@@ -139,7 +194,23 @@ class PlaywrightCleanupTracker:
             Async hook function for process_tool_call.
         """
 
-        async def hook(
+        track = self.track_tool_call
+
+        if existing_hook is None:
+
+            async def hook(
+                ctx: Any,
+                call_tool: Callable[..., Awaitable[Any]],
+                tool_name: str,
+                tool_args: dict[str, Any],
+            ) -> Any:
+                """Hook that tracks Playwright calls and calls the tool directly."""
+                track(tool_name, tool_args)
+                return await call_tool(tool_name, tool_args, None)
+
+            return hook
+
+        async def chained_hook(
             ctx: Any,
             call_tool: Callable[..., Awaitable[Any]],
             tool_name: str,
@@ -154,19 +225,12 @@ class PlaywrightCleanupTracker:
                 tool_args: Arguments for the tool.
 
             Returns:
-                Tool result from call_tool or existing_hook.
+                Tool result from existing_hook.
             """
-            # Track the call for cleanup
-            self.track_tool_call(tool_name, tool_args)
-
-            # Chain to existing hook if present
-            if existing_hook:
-                return await existing_hook(ctx, call_tool, tool_name, tool_args)
-
-            # Call the actual tool
-            return await call_tool(tool_name, tool_args, None)
+            track(tool_name, tool_args)
+            return await existing_hook(ctx, call_tool, tool_name, tool_args)
 
-        return hook
+        return chained_hook
 
     @property
     def needs_browser_cleanup(self) -> bool:
@@ -222,40 +286,35 @@ class PlaywrightCleanupTracker:
     def cleanup_screenshot_files(self, max_age_minutes: int = 30) -> int:
         """Clean up tracked screenshot files and old temp screenshots.
 
+        The temp directory is only swept once the session is older than
+        max_age_minutes; before that, screenshots taken in this session
+        cannot be old enough to delete.
+
         Args:
             max_age_minutes: Maximum age of temp files to keep (default: 30 min).
 
         Returns:
             Number of files deleted.
         """
+        now = time.time()
+        max_age_seconds = max_age_minutes * 60
+        sweep_needed = now - self._session_start > max_age_seconds
+        if not sweep_needed and not self.screenshot_files:
+            return 0
+
         deleted_count = 0
 
-        # Clean up tracked files
-        for filepath in self.screenshot_files:
-            try:
-                if os.path.exists(filepath):
-                    os.remove(filepath)
-                    deleted_count += 1
-                    logger.debug("Deleted tracked screenshot: %s", filepath)
-            except OSError as e:
-                logger.warning("Failed to delete screenshot %s: %s", filepath, e)
-
-        # Clean up old temp screenshots
-        cutoff_time = datetime.now() - timedelta(minutes=max_age_minutes)
-
-        for pattern in SCREENSHOT_PATTERNS:
-            temp_pattern = os.path.join(self.temp_dir, pattern)
-            for filepath in glob.glob(temp_pattern):
-                try:
-                    mtime = datetime.fromtimestamp(os.path.getmtime(filepath))
-                    if mtime < cutoff_time:
-                        os.remove(filepath)
-                        deleted_count += 1
-                        logger.debug("Deleted old screenshot: %s", filepath)
-                except OSError as e:
-                    logger.warning(
-                        "Failed to delete old screenshot %s: %s", filepath, e
-                    )
+        # Clean up tracked files, overlapping the unlink calls when there are many
+        files = self.screenshot_files
+        if len(files) > PARALLEL_DELETE_THRESHOLD:
+            workers = min(MAX_DELETE_WORKERS, len(files))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                deleted_count += sum(executor.map(_delete_tracked_file, files))
+        else:
+            deleted_count += sum(map(_delete_tracked_file, files))
+
+        if sweep_needed:
+            deleted_count += self._sweep_old_screenshots(now - max_age_seconds)
 
         if deleted_count > 0:
             logger.info("Cleaned up %d screenshot file(s)", deleted_count)
@@ -263,6 +322,38 @@ class PlaywrightCleanupTracker:
         self.screenshot_files.clear()
         return deleted_count
 
+    def _sweep_old_screenshots(self, cutoff_ts: float) -> int:
+        """Delete temp screenshots last modified before cutoff_ts.
+
+        Args:
+            cutoff_ts: Unix timestamp; older matching files are deleted.
+
+        Returns:
+            Number of files deleted.
+        """
+        deleted_count = 0
+        try:
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (
+                        name.endswith(SCREENSHOT_SUFFIX)
+                        and name.startswith(SCREENSHOT_PREFIXES)
+                    ):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff_ts:
+                            os.remove(entry.path)
+                            deleted_count += 1
+                            logger.debug("Deleted old screenshot: %s", entry.path)
+                    except OSError as e:
+                        logger.warning(
+                            "Failed to delete old screenshot %s: %s", entry.path, e
+                        )
+        except OSError as e:
+            logger.warning("Failed to scan %s for screenshots: %s", self.temp_dir, e)
+        return deleted_count
+
     async def cleanup(
         self,
         mcp_call: Callable[[str, dict], Awaitable[Any]] | None = None,
@@ -270,6 +361,8 @@ class PlaywrightCleanupTracker:
     ) -> dict[str, Any]:
         """Perform full cleanup.
 
+        Concurrent calls are serialized; all but the first are skipped.
+
         Args:
             mcp_call: Optional async function to call MCP tool for browser close.
             cleanup_files: Whether to clean up screenshot files.
@@ -277,33 +370,40 @@ class PlaywrightCleanupTracker:
         Returns:
             Dict with cleanup results.
         """
-        if self._cleanup_done:
-            logger.debug("Cleanup already performed")
-            return {"browser_closed": False, "files_deleted": 0, "skipped": True}
-
-        results = {
-            "browser_closed": False,
-            "files_deleted": 0,
-            "skipped": False,
-        }
-
-        # Close browser
-        if await self.cleanup_browser(mcp_call):
-            results["browser_closed"] = True
-
-        # Clean up files
-        if cleanup_files:
-            results["files_deleted"] = self.cleanup_screenshot_files()
-
-        self._cleanup_done = True
-        return results
+        if self._cleanup_lock is None:
+            self._cleanup_lock = asyncio.Lock()
+
+        # Serialize concurrent cleanups so the browser is closed only once
+        async with self._cleanup_lock:
+            if self._cleanup_done:
+                logger.debug("Cleanup already performed")
+                return {"browser_closed": False, "files_deleted": 0, "skipped": True}
+
+            results = {
+                "browser_closed": False,
+                "files_deleted": 0,
+                "skipped": False,
+            }
+
+            # Close browser
+            if await self.cleanup_browser(mcp_call):
+                results["browser_closed"] = True
+
+            # Clean up files
+            if cleanup_files:
+                results["files_deleted"] = await asyncio.to_thread(
+                    self.cleanup_screenshot_files
+                )
+
+            self._cleanup_done = True
+            return results
 
     def reset(self) -> None:
         """Reset tracker state for reuse."""
         self.browser_opened = False
         self.browser_closed = False
         self.screenshot_files.clear()
-        self._session_start = datetime.now()
+        self._session_start = time.time()
         self._cleanup_done = False
 
 
@@ -354,22 +454,150 @@ async def cleanup_playwright_session(
 # Server registration
 # ---------------------------------------------------------------------------
 
-_cleanup_tracker = PlaywrightCleanupTracker()
+# Arguments before the generated --config option
+SERVER_BASE_ARGS = (
+    "-y",
+    "@playwright/mcp@latest",
+    "--headless",
+    "--viewport-size=1920x1080",
+)
+
+# Chromium flags that skip subsystems a headless agent browser never uses
+CHROMIUM_LAUNCH_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-translate",
+    "--no-first-run",
+    "--mute-audio",
+)
+
+# Origins blocked when PLAYWRIGHT_MCP_BLOCK_RESOURCES is set
+DEFAULT_BLOCKED_ORIGINS = (
+    "https://www.google-analytics.com",
+    "https://www.googletagmanager.com",
+    "https://googleads.g.doubleclick.net",
+    "https://stats.g.doubleclick.net",
+    "https://connect.facebook.net",
+    "https://static.hotjar.com",
+    "https://cdn.segment.com",
+)
+
+
+def _write_server_config(config: dict[str, Any]) -> str | None:
+    """Write a @playwright/mcp --config file into the temp directory.
+
+    The file name is derived from the content, so processes using the same
+    config share one file.
+
+    Args:
+        config: Playwright MCP configuration.
+
+    Returns:
+        Path to the config file, or None if it could not be written.
+    """
+    data = json.dumps(config, sort_keys=True)
+    digest = hashlib.blake2b(data.encode(), digest_size=8).hexdigest()
+    path = os.path.join(tempfile.gettempdir(), f"playwright-mcp-{digest}.json")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Failed to write Playwright MCP config %s: %s", path, e)
+        return None
+    return path
+
+
+def _server_args() -> list[str]:
+    """Build the @playwright/mcp command-line arguments.
+
+    Called when the server is created rather than at import, so the
+    PLAYWRIGHT_MCP_BLOCK_* settings are read and the config file is written
+    only when Playwright is actually used.
+
+    Returns:
+        Arguments for npx.
+    """
+    args = list(SERVER_BASE_ARGS)
+    launch_args = list(CHROMIUM_LAUNCH_ARGS)
+    config: dict[str, Any] = {"browser": {"launchOptions": {"args": launch_args}}}
+
+    if os.environ.get("PLAYWRIGHT_MCP_BLOCK_RESOURCES") == "1":
+        launch_args.append("--blink-settings=imagesEnabled=false")
+        patterns = os.environ.get("PLAYWRIGHT_MCP_BLOCK_PATTERNS")
+        if patterns:
+            origins = [p.strip() for p in patterns.split(",") if p.strip()]
+        else:
+            origins = list(DEFAULT_BLOCKED_ORIGINS)
+        config["network"] = {"blockedOrigins": origins}
+
+    config_path = _write_server_config(config)
+    if config_path:
+        args.append(f"--config={config_path}")
+    return args
+
+
+# Tracker behind the registered cleanup hooks, created when a server is built
+_cleanup_tracker: PlaywrightCleanupTracker | None = None
+
+
+def _get_cleanup_tracker() -> PlaywrightCleanupTracker:
+    """Get or create the tracker used by the registered cleanup hooks."""
+    global _cleanup_tracker
+    if _cleanup_tracker is None:
+        _cleanup_tracker = PlaywrightCleanupTracker()
+    return _cleanup_tracker
+
+
+def _create_process_hook(
+    existing_hook: Callable[..., Awaitable[Any]] | None = None,
+) -> Callable[..., Awaitable[Any]]:
+    """Create the tracking process_tool_call hook for a Playwright server."""
+    return _get_cleanup_tracker().create_hook(existing_hook)
+
+
+def _needs_cleanup() -> bool:
+    """Check if the Playwright server needs cleanup (never if unused)."""
+    tracker = _cleanup_tracker
+    return tracker is not None and (
+        tracker.needs_browser_cleanup or tracker.needs_file_cleanup
+    )
+
+
+async def _cleanup(
+    mcp_call: Callable[[str, dict], Awaitable[Any]] | None = None,
+) -> dict[str, Any]:
+    """Run full cleanup on the server tracker."""
+    return await _get_cleanup_tracker().cleanup(mcp_call)
+
+
+def _cleanup_files() -> int:
+    """Clean up screenshot files tracked by the server tracker."""
+    return _get_cleanup_tracker().cleanup_screenshot_files()
+
+
+def _reset_cleanup_tracker() -> None:
+    """Reset the server tracker if it was created."""
+    if _cleanup_tracker is not None:
+        _cleanup_tracker.reset()
+
 
 register_mcp_server(
     key="playwright",
     name="Playwright",
     description="Browser automation for web testing, scraping, and interactions",
     command="npx",
-    args=["-y", "@playwright/mcp@latest", "--headless", "--viewport-size=1920x1080"],
+    args=list(SERVER_BASE_ARGS),
+    args_factory=_server_args,
     cleanup_hooks=ServerCleanupHooks(
-        create_process_hook=_cleanup_tracker.create_hook,
-        needs_cleanup=lambda: (
-            _cleanup_tracker.needs_browser_cleanup
-            or _cleanup_tracker.needs_file_cleanup
-        ),
-        cleanup_async=_cleanup_tracker.cleanup,
-        cleanup_sync=_cleanup_tracker.cleanup_screenshot_files,
-        reset=_cleanup_tracker.reset,
+        create_process_hook=_create_process_hook,
+        needs_cleanup=_needs_cleanup,
+        cleanup_async=_cleanup,
+        cleanup_sync=_cleanup_files,
+        reset=_reset_cleanup_tracker,
     ),
 )
@@ -81,9 +81,32 @@ class MCPManager:
         self._servers: list[MCPServerStdio] = []
         self._enable_guardrails = enable_guardrails
         self._guardrail_config = guardrail_config or GuardrailConfig()
+        # One guardrail hook shared by every server this manager creates
+        self._guardrail_hook: Callable[..., Awaitable[Any]] | None = (
+            create_guardrail_hook(self._guardrail_config) if enable_guardrails else None
+        )
         self._config_path = config_path
         self._server_configs = self._load_configs()
+        # Parent environment captured once; later os.environ changes are not seen
+        self._parent_env: dict[str, str] = dict(os.environ)
+        # name -> (available, missing env vars), checked once at construction
+        self._availability: dict[str, tuple[bool, list[str]]] = {
+            name: (
+                config.is_available(),
+                [env for env in config.requires_env if not os.environ.get(env)],
+            )
+            for name, config in self._server_configs.items()
+        }
         self._cleanup_hooks: dict[str, ServerCleanupHooks] = {}
+        # Pre-filtered views of _cleanup_hooks, filled by _register_cleanup_hooks
+        self._cleanup_checks: list[Callable[[], bool]] = []
+        self._async_cleaners: list[
+            tuple[str, Callable[[], bool], Callable[..., Any]]
+        ] = []
+        self._sync_cleaners: list[
+            tuple[str, Callable[[], bool], Callable[[], int]]
+        ] = []
+        self._resetters: list[Callable[[], None]] = []
 
     def _load_configs(self) -> dict[str, MCPServerConfig]:
         """Load server configs from auto-discovered servers, merged with JSON overrides."""
@@ -102,7 +125,8 @@ class MCPManager:
         """Create MCPServerStdio from config.
 
         CRITICAL: MCPServerStdio does NOT inherit parent env by default.
-        Must merge os.environ with config.env for npx/uvx to work.
+        Must merge os.environ with config.env for npx/uvx to work. The parent
+        environment is the snapshot taken when the manager was created.
 
         Args:
             name: Name of the MCP server (for logging).
@@ -111,12 +135,11 @@ class MCPManager:
         Returns:
             MCPServerStdio instance ready to be used as a toolset.
         """
-        # Create guardrail hook if enabled
-        hook: Callable[..., Awaitable[Any]] | None = None
-        if self._enable_guardrails:
-            hook = create_guardrail_hook(self._guardrail_config)
+        # Use the shared guardrail hook if enabled
+        hook = self._guardrail_hook
+        if hook is not None:
             logger.debug(
-                "Created guardrail hook for server '%s' (read_only=%s)",
+                "Applied guardrail hook for server '%s' (read_only=%s)",
                 name,
                 self._guardrail_config.read_only,
             )
@@ -124,21 +147,48 @@ class MCPManager:
         # Apply cleanup hooks from registry (if server defines them)
         if config.cleanup_hooks and config.cleanup_hooks.create_process_hook:
             hook = config.cleanup_hooks.create_process_hook(existing_hook=hook)
-            self._cleanup_hooks[name] = config.cleanup_hooks
+            self._register_cleanup_hooks(name, config.cleanup_hooks)
             logger.debug("Applied cleanup hooks for server '%s'", name)
 
         # IMPORTANT: Merge parent environment with config env
         # MCPServerStdio doesn't inherit parent env - npx/uvx need PATH, HOME, etc.
-        merged_env = {**os.environ, **(config.env or {})}
+        # Servers without overrides share the snapshot (only read by the server)
+        merged_env = (
+            {**self._parent_env, **config.env} if config.env else self._parent_env
+        )
 
         return MCPServerStdio(
             command=config.command,
-            args=config.args,
+            args=config.build_args(),
             env=merged_env,
             tool_prefix=config.tool_prefix,
             process_tool_call=hook,
         )
 
+    def _register_cleanup_hooks(self, name: str, hooks: ServerCleanupHooks) -> None:
+        """Record a server's cleanup hooks, sorted by which callables it defines.
+
+        Args:
+            name: Name of the MCP server.
+            hooks: Cleanup hooks from the server's registry entry.
+        """
+        if name in self._cleanup_hooks:
+            return
+        self._cleanup_hooks[name] = hooks
+
+        if hooks.needs_cleanup:
+            self._cleanup_checks.append(hooks.needs_cleanup)
+            if hooks.cleanup_async:
+                self._async_cleaners.append(
+                    (name, hooks.needs_cleanup, hooks.cleanup_async)
+                )
+            if hooks.cleanup_sync:
+                self._sync_cleaners.append(
+                    (name, hooks.needs_cleanup, hooks.cleanup_sync)
+                )
+        if hooks.reset:
+            self._resetters.append(hooks.reset)
+
     def connect(self, server_name: str) -> MCPServerStdio:
         """Create MCPServerStdio for a single server.
 
@@ -155,8 +205,8 @@ class MCPManager:
         if config is None:
             raise ValueError(f"MCP server '{server_name}' not found")
 
-        if not config.is_available():
-            missing = [env for env in config.requires_env if not os.environ.get(env)]
+        available, missing = self._availability[server_name]
+        if not available:
             raise ValueError(
                 f"MCP server '{server_name}' requires environment variables: {missing}"
             )
@@ -181,13 +231,9 @@ class MCPManager:
         Gracefully handles failures - logs warnings and continues with
         available servers.
         """
-        enabled_servers = {
-            name: config
-            for name, config in self._server_configs.items()
-            if config.is_available()
-        }
-
-        for server_name, config in enabled_servers.items():
+        for server_name, (available, _) in self._availability.items():
+            if not available:
+                continue
             try:
                 self.connect(server_name)
                 logger.info("Successfully created server '%s'", server_name)
@@ -233,10 +279,7 @@ class MCPManager:
 
     def needs_cleanup(self) -> bool:
         """Check if any server cleanup is needed."""
-        for hooks in self._cleanup_hooks.values():
-            if hooks.needs_cleanup and hooks.needs_cleanup():
-                return True
-        return False
+        return any(check() for check in self._cleanup_checks)
 
     async def cleanup_all(
         self,
@@ -244,10 +287,10 @@ class MCPManager:
     ) -> dict[str, Any]:
         """Run async cleanup for all servers that registered cleanup hooks."""
         results: dict[str, Any] = {}
-        for name, hooks in self._cleanup_hooks.items():
-            if hooks.cleanup_async and hooks.needs_cleanup and hooks.needs_cleanup():
+        for name, needs_cleanup, cleanup_async in self._async_cleaners:
+            if needs_cleanup():
                 try:
-                    result = await hooks.cleanup_async(mcp_call=mcp_call)
+                    result = await cleanup_async(mcp_call=mcp_call)
                     results[name] = result
                     logger.info("Cleanup completed for server '%s': %s", name, result)
                 except Exception as e:
@@ -258,10 +301,10 @@ class MCPManager:
     def cleanup_files_sync(self) -> int:
         """Synchronous file cleanup for all servers."""
         total_deleted = 0
-        for name, hooks in self._cleanup_hooks.items():
-            if hooks.cleanup_sync and hooks.needs_cleanup and hooks.needs_cleanup():
+        for name, needs_cleanup, cleanup_sync in self._sync_cleaners:
+            if needs_cleanup():
                 try:
-                    deleted = hooks.cleanup_sync()
+                    deleted = cleanup_sync()
                     total_deleted += deleted
                 except Exception as e:
                     logger.warning("Sync cleanup failed for '%s': %s", name, e)
@@ -269,30 +312,32 @@ class MCPManager:
 
     def reset_cleanup_trackers(self) -> None:
         """Reset all cleanup trackers for reuse."""
-        for hooks in self._cleanup_hooks.values():
-            if hooks.reset:
-                hooks.reset()
+        for reset in self._resetters:
+            reset()
 
     # --- Backward compatibility aliases ---
+    # Deprecated: use needs_cleanup(), cleanup_all() and cleanup_files_sync().
+    # Plain forwards are class attribute aliases, so they add no call frame.
 
-    def needs_playwright_cleanup(self) -> bool:
-        """Backward compat: check if any cleanup is needed."""
-        return self.needs_cleanup()
+    needs_playwright_cleanup = needs_cleanup
+    cleanup_playwright_files_sync = cleanup_files_sync
 
     async def cleanup_playwright(
         self,
         mcp_call: Callable[[str, dict], Awaitable[Any]] | None = None,
     ) -> dict[str, Any]:
-        """Backward compat: run all async cleanup."""
+        """Backward compat: run all async cleanup.
+
+        Deprecated: Use cleanup_all() instead.
+        """
         all_results = await self.cleanup_all(mcp_call)
         if "playwright" in all_results:
             return all_results["playwright"]
         return {"browser_closed": False, "files_deleted": 0, "skipped": True}
 
-    def cleanup_playwright_files_sync(self) -> int:
-        """Backward compat: sync file cleanup."""
-        return self.cleanup_files_sync()
-
     def get_playwright_tracker(self) -> Any:
-        """Backward compat: return None (use cleanup_hooks registry instead)."""
+        """Backward compat: return None (use cleanup_hooks registry instead).
+
+        Deprecated: Cleanup state lives behind the registry's cleanup hooks.
+        """
         return None
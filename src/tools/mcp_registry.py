@@ -30,12 +30,15 @@ import json
 import logging
 import os
 import pkgutil
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from mcp import StdioServerParameters
+if TYPE_CHECKING:
+    from mcp import StdioServerParameters
 
 logger = logging.getLogger(__name__)
 
@@ -57,11 +60,11 @@ def get_base_tool_name(tool_name: str) -> str:
     Returns:
         Base tool name without prefix (e.g., 'create_issue').
     """
-    if "_" not in tool_name:
-        return tool_name
-    parts = tool_name.split("_", 1)
-    if len(parts) == 2 and len(parts[0]) <= 10:
-        return parts[1]
+    # Same rule as splitting on the first "_" and keeping a <=10 char prefix,
+    # without building the split list
+    idx = tool_name.find("_")
+    if 0 <= idx <= 10:
+        return tool_name[idx + 1 :]
     return tool_name
 
 
@@ -69,8 +72,11 @@ def get_base_tool_name(tool_name: str) -> str:
 # Server guardrail rules
 # ---------------------------------------------------------------------------
 
+# Shared default for rule fields a server leaves unset
+_EMPTY_RULE_SET: frozenset[str] = frozenset()
 
-@dataclass
+
+@dataclass(slots=True)
 class ServerGuardrailRules:
     """Server-specific guardrail rules registered alongside server config.
 
@@ -88,15 +94,15 @@ class ServerGuardrailRules:
             Raises GuardrailViolation if blocked.
     """
 
-    write_tools: set[str] = field(default_factory=set)
-    read_only_tools: set[str] = field(default_factory=set)
-    sensitive_file_patterns: set[str] = field(default_factory=set)
-    sensitive_path_patterns: set[str] = field(default_factory=set)
-    safe_file_patterns: set[str] = field(default_factory=set)
+    write_tools: frozenset[str] = _EMPTY_RULE_SET
+    read_only_tools: frozenset[str] = _EMPTY_RULE_SET
+    sensitive_file_patterns: frozenset[str] = _EMPTY_RULE_SET
+    sensitive_path_patterns: frozenset[str] = _EMPTY_RULE_SET
+    safe_file_patterns: frozenset[str] = _EMPTY_RULE_SET
     custom_check: Callable[[str, tuple, dict[str, Any], Any], None] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerCleanupHooks:
     """Optional cleanup hooks that MCP servers can register.
 
@@ -130,7 +136,7 @@ class ServerCleanupHooks:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPServerConfig:
     """Configuration for a single MCP server.
 
@@ -145,6 +151,10 @@ class MCPServerConfig:
         tool_prefix: Optional prefix added to all tool names from this server.
             Use to avoid naming conflicts between servers (e.g., 'github_', 'sentry_').
         guardrail_rules: Optional server-specific guardrail rules.
+        cleanup_hooks: Optional cleanup hooks called by MCPManager.
+        args_factory: Optional callable building the full arguments when the
+            server is created, for arguments that depend on runtime state
+            (environment, generated files). Falls back to args if not set.
     """
 
     name: str
@@ -157,20 +167,36 @@ class MCPServerConfig:
     tool_prefix: str | None = None
     guardrail_rules: ServerGuardrailRules | None = None
     cleanup_hooks: ServerCleanupHooks | None = None
+    args_factory: Callable[[], list[str]] | None = None
 
-    def to_server_parameters(self) -> StdioServerParameters:
+    def to_server_parameters(self) -> "StdioServerParameters":
         """Convert to StdioServerParameters for MCPClient.
 
+        The mcp package is imported here rather than at module level so that
+        registering servers does not load the MCP SDK.
+
         Returns:
             StdioServerParameters instance ready for use with MCPClient.
         """
+        from mcp import StdioServerParameters
+
         merged_env = {**os.environ, **self.env}
         return StdioServerParameters(
             command=self.command,
-            args=self.args,
+            args=self.build_args(),
             env=merged_env,
         )
 
+    def build_args(self) -> list[str]:
+        """Get the command arguments, calling args_factory if one is set.
+
+        Returns:
+            Arguments for the server command.
+        """
+        if self.args_factory is not None:
+            return self.args_factory()
+        return self.args
+
     def is_available(self) -> bool:
         """Check if all required environment variables are set.
 
@@ -191,6 +217,11 @@ class MCPServerConfig:
 
 # Global registry populated by register_mcp_server() calls
 _registered_servers: dict[str, MCPServerConfig] = {}
+_registered_servers_view = MappingProxyType(_registered_servers)
+
+# Bumped whenever the registry or server cache changes so consumers can
+# invalidate state derived from it (e.g. compiled guardrail patterns)
+_registry_version = 0
 
 
 def register_mcp_server(
@@ -205,6 +236,7 @@ def register_mcp_server(
     tool_prefix: str | None = None,
     guardrail_rules: ServerGuardrailRules | None = None,
     cleanup_hooks: ServerCleanupHooks | None = None,
+    args_factory: Callable[[], list[str]] | None = None,
 ) -> MCPServerConfig:
     """Register an MCP server configuration.
 
@@ -222,6 +254,9 @@ def register_mcp_server(
         requires_env: Required environment variable names.
         tool_prefix: Optional prefix for tool names from this server.
         guardrail_rules: Optional server-specific guardrail rules.
+        cleanup_hooks: Optional cleanup hooks called by MCPManager.
+        args_factory: Optional callable building the arguments at server
+            creation instead of at registration (import) time.
 
     Returns:
         The created MCPServerConfig instance.
@@ -229,6 +264,7 @@ def register_mcp_server(
     Raises:
         ValueError: If key is empty.
     """
+    global _registry_version
     if not key or not key.strip():
         raise ValueError("MCP server key must not be empty")
 
@@ -246,19 +282,32 @@ def register_mcp_server(
         tool_prefix=tool_prefix,
         guardrail_rules=guardrail_rules,
         cleanup_hooks=cleanup_hooks,
+        args_factory=args_factory,
     )
     _registered_servers[key] = config
+    _registry_version += 1
     logger.debug("Registered MCP server: %s (%s)", key, name)
     return config
 
 
-def get_registered_servers() -> dict[str, MCPServerConfig]:
-    """Get a copy of all registered server configurations.
+def get_registered_servers() -> Mapping[str, MCPServerConfig]:
+    """Get a read-only view of all registered server configurations.
+
+    The view reflects later registrations; copy it with dict() to mutate.
 
     Returns:
-        Dictionary of server key to MCPServerConfig.
+        Mapping of server key to MCPServerConfig.
     """
-    return _registered_servers.copy()
+    return _registered_servers_view
+
+
+def get_registry_version() -> int:
+    """Get the current registry version.
+
+    Returns:
+        Counter incremented on every registration and server cache reset.
+    """
+    return _registry_version
 
 
 # ---------------------------------------------------------------------------
@@ -277,9 +326,8 @@ def auto_discover_mcp_servers(
     Imports all Python modules in the given package. Each module is expected
     to call register_mcp_server() at module level during import.
 
-    If a module was already imported (cached in sys.modules), it is reloaded
-    to ensure register_mcp_server() is re-executed. This handles the case
-    where _registered_servers was cleared (e.g., by tests).
+    Modules already in sys.modules are skipped without going through the
+    import machinery; they registered their servers when first imported.
 
     Args:
         package_path: Python package path to scan. Defaults to "src.tools.mcp".
@@ -297,13 +345,19 @@ def auto_discover_mcp_servers(
         logger.warning("Package %s has no __path__ attribute", package_path)
         return _registered_servers.copy()
 
+    # Locals for the per-module loop
+    loaded_modules = sys.modules
+    import_module = importlib.import_module
+
     for _, name, is_pkg in pkgutil.iter_modules(package.__path__):
         if is_pkg:
             continue
 
         module_name = f"{package_path}.{name}"
+        if module_name in loaded_modules:
+            continue
         try:
-            importlib.import_module(module_name)
+            import_module(module_name)
             logger.debug("Loaded MCP server module: %s", name)
         except Exception as e:
             logger.warning(
@@ -342,8 +396,9 @@ def get_mcp_servers() -> dict[str, MCPServerConfig]:
 
 def reset_mcp_servers_cache() -> None:
     """Reset the server cache. Useful for testing."""
-    global _mcp_servers_cache
+    global _mcp_servers_cache, _registry_version
     _mcp_servers_cache = None
+    _registry_version += 1
 
 
 def get_all_guardrail_rules() -> list[ServerGuardrailRules]:
@@ -355,8 +410,12 @@ def get_all_guardrail_rules() -> list[ServerGuardrailRules]:
     Returns:
         List of ServerGuardrailRules from registered servers.
     """
-    servers = get_mcp_servers()
-    return [c.guardrail_rules for c in servers.values() if c.guardrail_rules]
+    # get_mcp_servers() returns the cached dict itself, so nothing is copied
+    return [
+        rules
+        for config in get_mcp_servers().values()
+        if (rules := config.guardrail_rules) is not None
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -364,10 +423,12 @@ def get_all_guardrail_rules() -> list[ServerGuardrailRules]:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
 def _expand_env_vars(value: str) -> str:
     """Expand environment variables in a string.
 
-    Supports ${VAR} and $VAR syntax.
+    Supports ${VAR} and $VAR syntax. Results are cached; load_from_json
+    clears the cache on entry so each load sees the current environment.
 
     Args:
         value: String potentially containing env vars.
@@ -378,6 +439,41 @@ def _expand_env_vars(value: str) -> str:
     return os.path.expandvars(value)
 
 
+# config path -> (mtime_ns, size, parsed JSON); reused while the file is unchanged
+_json_cache: dict[str, tuple[int, int, Any]] = {}
+
+
+def _read_json(config_path: str) -> Any:
+    """Parse a JSON file, reusing the last result if the file is unchanged.
+
+    The returned data is shared between callers and must not be mutated.
+
+    Args:
+        config_path: Path to the JSON file.
+
+    Returns:
+        Parsed JSON data.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        json.JSONDecodeError: If the file is invalid JSON.
+    """
+    try:
+        st = os.stat(config_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"MCP config file not found: {config_path}") from None
+
+    cached = _json_cache.get(config_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    # json.loads accepts bytes, so skip the text-mode decode layer
+    with open(config_path, "rb") as f:
+        data = json.loads(f.read())
+    _json_cache[config_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
 def load_from_json(config_path: str) -> dict[str, MCPServerConfig]:
     """Load MCP server configurations from a JSON file.
 
@@ -404,13 +500,8 @@ def load_from_json(config_path: str) -> dict[str, MCPServerConfig]:
         FileNotFoundError: If config file doesn't exist.
         json.JSONDecodeError: If config file is invalid JSON.
     """
-    path = Path(config_path)
-    if not path.exists():
-        raise FileNotFoundError(f"MCP config file not found: {config_path}")
-
-    with open(path) as f:
-        data = json.load(f)
-
+    data = _read_json(config_path)
+    _expand_env_vars.cache_clear()
     servers_data = data.get("mcpServers", data)
 
     configs: dict[str, MCPServerConfig] = {}
@@ -23,6 +23,7 @@ import importlib
 import inspect
 import logging
 import pkgutil
+import sys
 from collections.abc import Callable
 from typing import Any, TypeVar
 
@@ -36,6 +37,9 @@ F = TypeVar("F", bound=Callable[..., Any])
 # Set of registered tool function names (populated by @register_tool decorator)
 _registered_tools: set[str] = set()
 
+# Frozen snapshot returned by get_registered_tools(), rebuilt after registration
+_registered_tools_snapshot: frozenset[str] | None = None
+
 # Modules to exclude from auto-registration (currently none)
 EXCLUDED_MODULES: set[str] = set()
 
@@ -58,18 +62,23 @@ def register_tool(func: F) -> F:
             '''Search for something.'''
             return f"Found: {query}"
     """
+    global _registered_tools_snapshot
     _registered_tools.add(func.__name__)
+    _registered_tools_snapshot = None
     logger.debug("Registered tool via decorator: %s", func.__name__)
     return func
 
 
-def get_registered_tools() -> set[str]:
+def get_registered_tools() -> frozenset[str]:
     """Get the set of registered tool names.
 
     Returns:
-        Set of tool function names registered via @register_tool.
+        Frozen set of tool function names registered via @register_tool.
     """
-    return _registered_tools.copy()
+    global _registered_tools_snapshot
+    if _registered_tools_snapshot is None:
+        _registered_tools_snapshot = frozenset(_registered_tools)
+    return _registered_tools_snapshot
 
 
 def is_tool_function(obj: Any, name: str) -> bool:
@@ -124,6 +133,7 @@ def auto_register_tools(toolset: FunctionToolset, package_path: str) -> int:
     """
     count = 0
     registered_names: list[str] = []
+    registered = _registered_tools
 
     try:
         package = importlib.import_module(package_path)
@@ -136,6 +146,10 @@ def auto_register_tools(toolset: FunctionToolset, package_path: str) -> int:
         logger.warning("Package %s has no __path__ attribute", package_path)
         return 0
 
+    # Locals for the per-module loop
+    loaded_modules = sys.modules
+    import_module = importlib.import_module
+
     for _, name, is_pkg in pkgutil.iter_modules(package.__path__):
         # Skip packages and excluded modules
         if is_pkg or name in EXCLUDED_MODULES:
@@ -144,15 +158,21 @@ def auto_register_tools(toolset: FunctionToolset, package_path: str) -> int:
             )
             continue
 
+        # Already-imported modules skip the import machinery
+        module_name = f"{package_path}.{name}"
+        module = loaded_modules.get(module_name)
         try:
-            module = importlib.import_module(f"{package_path}.{name}")
+            if module is None:
+                module = import_module(module_name)
         except ImportError as e:
             logger.warning("Failed to import module %s.%s: %s", package_path, name, e)
             continue
 
-        # Find and register tool functions in this module
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
+        # Find and register tool functions in this module; the name check
+        # comes first since most module attributes are not registered tools
+        for attr_name, attr in vars(module).items():
+            if attr_name not in registered:
+                continue
 
             if is_tool_function(attr, attr_name):
                 try:
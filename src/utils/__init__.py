@@ -1,18 +1,38 @@
 # src/utils/__init__.py
-"""Utility functions for the personal AI agent."""
+"""Utility functions for the personal AI agent.
 
-from src.utils.image_handler import (
-    ImageData,
-    extract_images_from_result,
-    has_images,
-)
-from src.utils.logging import (
-    configure_structured_logging,
-    get_logger,
-    get_request_id,
-    set_request_id,
-)
-from src.utils.observability import setup_logfire
+Exports are imported on first attribute access (PEP 562), so importing one
+submodule (e.g. src.utils.image_handler) does not load the others.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.utils.image_handler import (
+        ImageData,
+        extract_images_from_result,
+        has_images,
+    )
+    from src.utils.logging import (
+        configure_structured_logging,
+        get_logger,
+        get_request_id,
+        set_request_id,
+    )
+    from src.utils.observability import setup_logfire
+
+# Exported name -> defining submodule
+_LAZY_EXPORTS = {
+    "ImageData": "src.utils.image_handler",
+    "extract_images_from_result": "src.utils.image_handler",
+    "has_images": "src.utils.image_handler",
+    "configure_structured_logging": "src.utils.logging",
+    "get_logger": "src.utils.logging",
+    "get_request_id": "src.utils.logging",
+    "set_request_id": "src.utils.logging",
+    "setup_logfire": "src.utils.observability",
+}
 
 __all__ = [
     "extract_images_from_result",
@@ -24,3 +44,13 @@ __all__ = [
     "get_request_id",
     "configure_structured_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -5,15 +5,21 @@ Extracts and processes images from MCP tool responses (e.g., Playwright screensh
 Supports detection, extraction, and conversion of base64 encoded images.
 """
 
-import base64
+import binascii
 import logging
-from dataclasses import dataclass
+import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Pattern for data URI: data:image/xxx;base64,<base64data>
+# Shared with the Slack thread-history extractor so both accept the same types
+DATA_URI_RE = re.compile(r"data:(image/[a-zA-Z0-9.+-]+);base64,([A-Za-z0-9+/=]+)")
 
-@dataclass
+
+@dataclass(slots=True)
 class ImageData:
     """Container for image data extracted from MCP tool output.
 
@@ -21,36 +27,31 @@ class ImageData:
         data: Raw image bytes (decoded from base64).
         mime_type: MIME type of the image (e.g., "image/png").
         filename: Optional filename for the image.
+        extension: File extension derived from mime_type at construction.
     """
 
     data: bytes
     mime_type: str
     filename: str | None = None
+    extension: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def extension(self) -> str:
-        """Get file extension from MIME type."""
+    def __post_init__(self) -> None:
         # image/png -> png, image/jpeg -> jpeg
-        return self.mime_type.split("/")[-1] if "/" in self.mime_type else "png"
+        idx = self.mime_type.rfind("/")
+        self.extension = self.mime_type[idx + 1 :] if idx >= 0 else "png"
 
     def to_data_uri(self) -> str:
         """Convert to data URI format for embedding in HTML/JSON."""
-        b64 = base64.b64encode(self.data).decode("utf-8")
-        return f"data:{self.mime_type};base64,{b64}"
-
-
-def _is_image_item(item: Any) -> bool:
-    """Check if a content item contains image data."""
-    if not isinstance(item, dict):
-        return False
-    item_type = item.get("type")
-    if item_type == "image":
-        return True
-    # Playwright MCP returns images as type="binary" with media_type="image/..."
-    if item_type == "binary":
-        media_type = item.get("media_type", "")
-        return media_type.startswith("image/")
-    return False
+        # Assemble the URI as bytes and decode once, so the (possibly
+        # megabyte-sized) base64 payload is not copied into an interim str
+        return b"".join(
+            (
+                b"data:",
+                self.mime_type.encode(),
+                b";base64,",
+                binascii.b2a_base64(self.data, newline=False),
+            )
+        ).decode()
 
 
 def has_images(result: Any) -> bool:
@@ -73,7 +74,16 @@ def has_images(result: Any) -> bool:
     if not isinstance(content, list):
         return False
 
-    return any(_is_image_item(item) for item in content)
+    for item in content:
+        if not isinstance(item, dict):
+            continue
+        item_type = item.get("type")
+        if item_type == "image":
+            return True
+        # Playwright MCP returns images as type="binary" with media_type="image/..."
+        if item_type == "binary" and item.get("media_type", "").startswith("image/"):
+            return True
+    return False
 
 
 def extract_data_uri_images(text: str) -> list[ImageData]:
@@ -87,27 +97,20 @@ def extract_data_uri_images(text: str) -> list[ImageData]:
     Returns:
         List of ImageData objects extracted from data URIs.
     """
-    import re
+    # Substring checks are far cheaper than a regex scan of text without images
+    if "data:image/" not in text or ";base64," not in text:
+        return []
 
     images: list[ImageData] = []
 
-    # Pattern for data URI: data:image/xxx;base64,<base64data>
-    pattern = r"data:(image/[a-zA-Z0-9+-]+);base64,([A-Za-z0-9+/=]+)"
-    matches = re.findall(pattern, text)
-
-    for idx, (mime_type, b64_data) in enumerate(matches):
+    for idx, match in enumerate(DATA_URI_RE.finditer(text)):
+        mime_type, b64_data = match.groups()
         try:
-            image_bytes = base64.b64decode(b64_data)
-            ext = mime_type.split("/")[-1] if "/" in mime_type else "png"
-            filename = f"generated_{idx}.{ext}"
-
-            images.append(
-                ImageData(
-                    data=image_bytes,
-                    mime_type=mime_type,
-                    filename=filename,
-                )
-            )
+            image_bytes = binascii.a2b_base64(b64_data)
+            image = ImageData(data=image_bytes, mime_type=mime_type)
+            image.filename = filename = f"generated_{idx}.{image.extension}"
+
+            images.append(image)
             logger.debug(
                 f"Extracted data URI image: {filename} ({len(image_bytes)} bytes)"
             )
@@ -118,6 +121,83 @@ def extract_data_uri_images(text: str) -> list[ImageData]:
     return images
 
 
+def _extract_image_item(item: dict, idx: int, images: list[ImageData]) -> None:
+    """Extract an MCP image item (type="image")."""
+    data_b64 = item.get("data")
+    if not data_b64 or not isinstance(data_b64, str):
+        logger.warning("Image item missing 'data' field at index %d", idx)
+        return
+
+    try:
+        image_bytes = binascii.a2b_base64(data_b64)
+        image = ImageData(data=image_bytes, mime_type=item.get("mimeType", "image/png"))
+        image.filename = f"screenshot_{idx}.{image.extension}"
+
+        images.append(image)
+    except Exception as e:
+        logger.warning("Failed to decode image at index %d: %s", idx, e)
+
+
+def _extract_binary_item(item: dict, idx: int, images: list[ImageData]) -> None:
+    """Extract a Playwright MCP image (type="binary", media_type="image/...")."""
+    media_type = item.get("media_type", "")
+    if not media_type.startswith("image/"):
+        return
+
+    data_b64 = item.get("content")
+    if not data_b64 or not isinstance(data_b64, str):
+        logger.warning("Binary image item missing 'content' field at index %d", idx)
+        return
+
+    try:
+        image_bytes = binascii.a2b_base64(data_b64)
+        image = ImageData(data=image_bytes, mime_type=media_type)
+        image.filename = filename = f"screenshot_{idx}.{image.extension}"
+
+        images.append(image)
+        logger.info(
+            "Extracted Playwright screenshot: %s (%d bytes)",
+            filename,
+            len(image_bytes),
+        )
+    except Exception as e:
+        logger.warning("Failed to decode binary image at index %d: %s", idx, e)
+
+
+def _extract_text_item(item: dict, idx: int, images: list[ImageData]) -> None:
+    """Extract data URI images from a text item (from generate_image tool)."""
+    text = item.get("text", "")
+    if text:
+        images.extend(extract_data_uri_images(text))
+
+
+def _has_image_candidates(content: list) -> bool:
+    """Cheaply check whether any content item can yield an image.
+
+    Image and binary items always go through extraction (so malformed items
+    are still logged); text items only when they contain a base64 data URI.
+    """
+    for item in content:
+        if not isinstance(item, dict):
+            continue
+        item_type = item.get("type")
+        if item_type == "image" or item_type == "binary":
+            return True
+        if item_type == "text":
+            text = item.get("text")
+            if isinstance(text, str) and "data:image/" in text and ";base64," in text:
+                return True
+    return False
+
+
+# Content item type -> extractor appending the item's images
+_ITEM_EXTRACTORS: dict[str, Callable[[dict, int, list[ImageData]], None]] = {
+    "image": _extract_image_item,
+    "binary": _extract_binary_item,
+    "text": _extract_text_item,
+}
+
+
 def extract_images_from_result(result: Any) -> list[ImageData]:
     """Extract all images from tool output.
 
@@ -141,77 +221,20 @@ def extract_images_from_result(result: Any) -> list[ImageData]:
     if not isinstance(content, list):
         return images
 
+    # Text-only outputs (the common case) skip the extraction loop entirely
+    if not _has_image_candidates(content):
+        return images
+
     for idx, item in enumerate(content):
         if not isinstance(item, dict):
             continue
 
         item_type = item.get("type")
-
-        # Handle MCP image format (type="image")
-        if item_type == "image":
-            data_b64 = item.get("data")
-            if not data_b64 or not isinstance(data_b64, str):
-                logger.warning("Image item missing 'data' field at index %d", idx)
-                continue
-
-            try:
-                image_bytes = base64.b64decode(data_b64)
-                mime_type = item.get("mimeType", "image/png")
-
-                ext = mime_type.split("/")[-1] if "/" in mime_type else "png"
-                filename = f"screenshot_{idx}.{ext}"
-
-                images.append(
-                    ImageData(
-                        data=image_bytes,
-                        mime_type=mime_type,
-                        filename=filename,
-                    )
-                )
-            except Exception as e:
-                logger.warning("Failed to decode image at index %d: %s", idx, e)
-                continue
-
-        # Handle Playwright MCP format (type="binary" with media_type="image/...")
-        elif item_type == "binary":
-            media_type = item.get("media_type", "")
-            if not media_type.startswith("image/"):
-                continue
-
-            data_b64 = item.get("content")
-            if not data_b64 or not isinstance(data_b64, str):
-                logger.warning(
-                    "Binary image item missing 'content' field at index %d", idx
-                )
-                continue
-
-            try:
-                image_bytes = base64.b64decode(data_b64)
-                ext = media_type.split("/")[-1] if "/" in media_type else "png"
-                filename = f"screenshot_{idx}.{ext}"
-
-                images.append(
-                    ImageData(
-                        data=image_bytes,
-                        mime_type=media_type,
-                        filename=filename,
-                    )
-                )
-                logger.info(
-                    "Extracted Playwright screenshot: %s (%d bytes)",
-                    filename,
-                    len(image_bytes),
-                )
-            except Exception as e:
-                logger.warning("Failed to decode binary image at index %d: %s", idx, e)
-                continue
-
-        # Handle text containing data URIs (from generate_image tool)
-        elif item_type == "text":
-            text = item.get("text", "")
-            if "data:image/" in text and ";base64," in text:
-                data_uri_images = extract_data_uri_images(text)
-                images.extend(data_uri_images)
+        extract = (
+            _ITEM_EXTRACTORS.get(item_type) if isinstance(item_type, str) else None
+        )
+        if extract is not None:
+            extract(item, idx, images)
 
     return images
 
@@ -232,11 +255,11 @@ def extract_text_from_result(result: Any) -> str:
     if not isinstance(content, list):
         return str(result) if result else ""
 
-    texts = []
-    for item in content:
-        if isinstance(item, dict) and item.get("type") == "text":
-            text = item.get("text", "")
-            if text:
-                texts.append(text)
-
+    texts = [
+        text
+        for item in content
+        if isinstance(item, dict)
+        and item.get("type") == "text"
+        and (text := item.get("text"))
+    ]
     return "\n".join(texts) if texts else str(result)
@@ -15,14 +15,31 @@ Key differences:
 """
 
 import re
+from functools import lru_cache
 
 # Zero-width space - invisible but creates word boundary for Slack
 ZWS = "\u200b"
 
-
+_FENCED_CODE_RE = re.compile(r"```[\s\S]*?```")
+_INLINE_CODE_RE = re.compile(r"`[^`]+`")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+_STRIKE_RE = re.compile(r"~~([^~]+)~~")
+_LIST_ITEM_RE = re.compile(r"^[\-\*]\s+", re.MULTILINE)
+_HR_RE = re.compile(r"^[-*_]{3,}$", re.MULTILINE)
+_TABLE_RE = re.compile(r"(?:^\|.+\|\n?)+", re.MULTILINE)
+_TABLE_SEPARATOR_RE = re.compile(r"^\|[\s\-:|]+\|$")
+_CODE_LANG_RE = re.compile(r"```\w*\n")
+_PLACEHOLDER_RE = re.compile(r"\x00(CODEBLOCK|INLINECODE)(\d+)\x00")
+
+
+@lru_cache(maxsize=256)
 def markdown_to_mrkdwn(text: str) -> str:
     """Convert standard Markdown to Slack mrkdwn format.
 
+    Results are cached, so re-sending the same text skips the conversion.
+
     Args:
         text: Standard Markdown text.
 
@@ -42,7 +59,7 @@ def markdown_to_mrkdwn(text: str) -> str:
         return f"\x00CODEBLOCK{len(code_blocks) - 1}\x00"
 
     # Save fenced code blocks (```...```)
-    result = re.sub(r"```[\s\S]*?```", save_code_block, result)
+    result = _FENCED_CODE_RE.sub(save_code_block, result)
 
     # Save inline code (`...`)
     inline_codes: list[str] = []
@@ -51,18 +68,18 @@ def markdown_to_mrkdwn(text: str) -> str:
         inline_codes.append(match.group(0))
         return f"\x00INLINECODE{len(inline_codes) - 1}\x00"
 
-    result = re.sub(r"`[^`]+`", save_inline_code, result)
+    result = _INLINE_CODE_RE.sub(save_inline_code, result)
 
     # 2. Convert links: [text](url) -> <url|text>
-    result = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"<\2|\1>", result)
+    result = _LINK_RE.sub(r"<\2|\1>", result)
 
     # 3. Convert headings: # Heading -> *Heading*
     # Must do before bold conversion
-    result = re.sub(r"^#{1,6}\s+(.+)$", r"*\1*", result, flags=re.MULTILINE)
+    result = _HEADING_RE.sub(r"*\1*", result)
 
     # 4. Convert bold: **text** -> *text*
     # Be careful not to convert already-converted headings or italic
-    result = re.sub(r"\*\*([^*]+)\*\*", r"*\1*", result)
+    result = _BOLD_RE.sub(r"*\1*", result)
 
     # 5. Convert italic with asterisks to underscores
     # Single * that's not part of ** -> _text_
@@ -71,10 +88,10 @@ def markdown_to_mrkdwn(text: str) -> str:
     # After step 4, all **text** became *text*, so we skip this to avoid conflicts
 
     # 6. Convert strikethrough: ~~text~~ -> ~text~
-    result = re.sub(r"~~([^~]+)~~", r"~\1~", result)
+    result = _STRIKE_RE.sub(r"~\1~", result)
 
     # 7. Convert unordered lists: - item or * item -> • item
-    result = re.sub(r"^[\-\*]\s+", "• ", result, flags=re.MULTILINE)
+    result = _LIST_ITEM_RE.sub("• ", result)
 
     # 8. Convert blockquotes: > quote -> >quote (remove space after >)
     # Slack requires no space, but we keep it readable
@@ -82,14 +99,14 @@ def markdown_to_mrkdwn(text: str) -> str:
     # result = re.sub(r'^>\s+', '>', result, flags=re.MULTILINE)
 
     # 9. Convert horizontal rules: --- or *** or ___ -> ───────
-    result = re.sub(r"^[-*_]{3,}$", "───────────────", result, flags=re.MULTILINE)
+    result = _HR_RE.sub("───────────────", result)
 
     # 10. Convert tables to simple format (basic support)
     # Tables aren't supported in Slack mrkdwn, convert to plain text
     def convert_table(match: re.Match) -> str:
         lines = match.group(0).strip().split("\n")
         # Remove separator line (|---|---|)
-        lines = [line for line in lines if not re.match(r"^\|[\s\-:|]+\|$", line)]
+        lines = [line for line in lines if not _TABLE_SEPARATOR_RE.match(line)]
         # Convert | col1 | col2 | to col1    col2
         converted = []
         for line in lines:
@@ -98,17 +115,17 @@ def markdown_to_mrkdwn(text: str) -> str:
         return "\n".join(converted)
 
     # Match tables (lines starting with |)
-    result = re.sub(r"(?:^\|.+\|\n?)+", convert_table, result, flags=re.MULTILINE)
+    result = _TABLE_RE.sub(convert_table, result)
 
-    # 11. Restore code blocks
-    for i, code in enumerate(code_blocks):
-        # Remove language identifier from code blocks for Slack
-        cleaned_code = re.sub(r"```\w*\n", "```\n", code)
-        result = result.replace(f"\x00CODEBLOCK{i}\x00", cleaned_code)
+    # 11-12. Restore code blocks and inline code in a single pass
+    def restore(match: re.Match) -> str:
+        if match.group(1) == "CODEBLOCK":
+            # Remove language identifier from code blocks for Slack
+            return _CODE_LANG_RE.sub("```\n", code_blocks[int(match.group(2))])
+        return inline_codes[int(match.group(2))]
 
-    # 12. Restore inline code
-    for i, code in enumerate(inline_codes):
-        result = result.replace(f"\x00INLINECODE{i}\x00", code)
+    if code_blocks or inline_codes:
+        result = _PLACEHOLDER_RE.sub(restore, result)
 
     # 13. Add zero-width spaces around formatting markers for Slack compatibility
     # This ensures *bold*, _italic_, ~strike~ work even when adjacent to other chars
@@ -2,7 +2,7 @@
 """Shared pytest fixtures for all test modules.
 
 Provides common fixtures for:
-- Singleton reset (SchedulerManager, etc.)
+- Singleton and cache reset (SchedulerManager, AgentRunnerPool, etc.)
 - Temporary database paths
 - Mock environment variables
 """
@@ -88,6 +88,37 @@ def reset_toolset_singleton() -> Generator[None, None, None]:
     src.tools._custom_toolset = original
 
 
+@pytest.fixture(autouse=True)
+def reset_agent_runner_pool() -> Generator[None, None, None]:
+    """Reset AgentRunnerPool singleton before and after each test.
+
+    Prevents runners (often mocks) pooled by one test from being handed
+    out in another.
+    """
+    import src.core.agent.pool
+
+    src.core.agent.pool._pool = None
+
+    yield
+
+    src.core.agent.pool._pool = None
+
+
+@pytest.fixture(autouse=True)
+def reset_slack_context_cache() -> Generator[None, None, None]:
+    """Clear cached Slack thread/channel history before and after each test.
+
+    Tests reuse the same channel and timestamps with different mock clients.
+    """
+    from src.interfaces.slack.context import clear_context_cache
+
+    clear_context_cache()
+
+    yield
+
+    clear_context_cache()
+
+
 @pytest.fixture
 def mock_env_vars() -> Generator[dict[str, str], None, None]:
     """Provide mock environment variables for testing.
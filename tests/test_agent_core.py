@@ -329,3 +329,110 @@ class TestAgentRunnerMessageHistory:
             assert len(history) == 2
             assert "msg_1" in history
             assert "msg_2" in history
+
+
+class TestAgentRunnerPool:
+    """Test AgentRunnerPool reuse and discard behavior."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_reuses_runner_for_same_key(self):
+        """Test a released runner is handed out again for the same key."""
+        from src.core.agent.pool import AgentRunnerPool
+
+        pool = AgentRunnerPool(max_idle_per_key=1)
+        factory = MagicMock(side_effect=lambda: MagicMock())
+
+        async with pool.acquire("U1", factory) as first:
+            pass
+        async with pool.acquire("U1", factory) as second:
+            pass
+        async with pool.acquire("U2", factory) as other:
+            pass
+
+        assert second is first
+        assert other is not first
+        assert factory.call_count == 2
+        first.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_release_cleans_up_run_files(self):
+        """Test run files are cleaned up when a runner goes back to the pool."""
+        from src.core.agent.pool import AgentRunnerPool
+
+        pool = AgentRunnerPool()
+        runner = MagicMock()
+
+        async with pool.acquire("U1", lambda: runner):
+            runner.cleanup_files.assert_not_called()
+
+        runner.cleanup_files.assert_called_once()
+        runner.close.assert_not_called()
+        assert pool.idle_count("U1") == 1
+
+    @pytest.mark.asyncio
+    async def test_acquire_discards_runner_on_error(self):
+        """Test a runner whose run raised is closed instead of pooled."""
+        from src.core.agent.pool import AgentRunnerPool
+
+        pool = AgentRunnerPool()
+        runner = MagicMock()
+
+        with pytest.raises(RuntimeError):
+            async with pool.acquire("U1", lambda: runner):
+                raise RuntimeError("boom")
+
+        runner.close.assert_called_once()
+        assert pool.idle_count("U1") == 0
+
+    @pytest.mark.asyncio
+    async def test_release_closes_runner_beyond_idle_limit(self):
+        """Test runners beyond max_idle_per_key are closed on release."""
+        from src.core.agent.pool import AgentRunnerPool
+
+        pool = AgentRunnerPool(max_idle_per_key=1)
+        runners = [MagicMock(), MagicMock()]
+        factory = MagicMock(side_effect=runners)
+
+        async with pool.acquire("U1", factory), pool.acquire("U1", factory):
+            pass
+
+        assert pool.idle_count("U1") == 1
+        runners[0].close.assert_called_once()
+
+        pool.shutdown()
+        runners[1].close.assert_called_once()
+        assert pool.idle_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_key_evicted(self):
+        """Test the oldest key's runners are closed beyond max_keys."""
+        from src.core.agent.pool import AgentRunnerPool
+
+        pool = AgentRunnerPool(max_keys=2)
+        runners = {key: MagicMock() for key in ("U1", "U2", "U3")}
+
+        for key in ("U1", "U2", "U1", "U3"):
+            async with pool.acquire(key, lambda key=key: runners[key]):
+                pass
+
+        runners["U2"].close.assert_called_once()
+        runners["U1"].close.assert_not_called()
+        assert pool.idle_count("U1") == 1
+        assert pool.idle_count("U2") == 0
+
+    @pytest.mark.asyncio
+    async def test_expired_idle_runner_closed(self):
+        """Test runners idle for longer than idle_ttl are closed, not reused."""
+        from src.core.agent.pool import AgentRunnerPool
+
+        pool = AgentRunnerPool(idle_ttl=0)
+        runners = [MagicMock(), MagicMock()]
+        factory = MagicMock(side_effect=runners)
+
+        async with pool.acquire("U1", factory):
+            pass
+        async with pool.acquire("U1", factory) as second:
+            pass
+
+        assert second is runners[1]
+        runners[0].close.assert_called_once()
@@ -200,6 +200,11 @@ class TestStatusEndpoint:
 class TestWebhookCallback:
     """Tests for webhook callback functionality."""
 
+    @pytest.fixture(autouse=True)
+    def reset_webhook_client(self, monkeypatch):
+        """Drop the shared webhook client so each test sees its own mock."""
+        monkeypatch.setattr("src.interfaces.api.tasks._webhook_client", None)
+
     @pytest.mark.asyncio
     async def test_send_webhook_success(self):
         """Test webhook is sent on successful task completion."""
@@ -417,6 +422,65 @@ class TestBackgroundTaskExecution:
             assert call_args[0][1]["status"] == "success"
 
 
+class TestTaskRepository:
+    """Tests for SQLite-backed task persistence."""
+
+    def test_create_update_get_roundtrip(self, tmp_path):
+        """Test a task round-trips with epoch timestamps and JSON columns."""
+        from src.interfaces.api.task_repository import TaskRepository
+
+        repo = TaskRepository(db_path=str(tmp_path / "tasks.db"))
+        created = repo.create("task-1")
+        updated = repo.update(
+            "task-1",
+            status="success",
+            result="Done",
+            tool_calls=["search"],
+            images=[{"data": "aGk=", "mime_type": "image/png", "filename": None}],
+        )
+
+        assert updated is not None
+        assert updated.status == "success"
+        assert updated.tool_calls == ["search"]
+        assert updated.images[0]["mime_type"] == "image/png"
+        assert isinstance(updated.created_at, float)
+        assert updated.created_at == created.created_at
+        assert updated.updated_at >= created.updated_at
+
+    def test_migrates_iso_timestamp_schema(self, tmp_path):
+        """Test tables from the ISO-string schema are converted on startup."""
+        import sqlite3
+        import time
+        from datetime import datetime
+
+        from src.interfaces.api.task_repository import TaskRepository
+
+        db_path = str(tmp_path / "tasks.db")
+        now = datetime.now().isoformat()
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE tasks (
+                task_id TEXT PRIMARY KEY, status TEXT NOT NULL, result TEXT,
+                error_message TEXT, execution_time REAL, tool_calls TEXT NOT NULL,
+                model_used TEXT NOT NULL, images TEXT NOT NULL,
+                created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO tasks VALUES ('old', 'success', 'r', NULL, 1.0,"
+            " '[]', 'model', '[]', ?, ?)",
+            (now, now),
+        )
+        conn.commit()
+        conn.close()
+
+        task = TaskRepository(db_path=db_path).get("old")
+
+        assert task is not None
+        assert task.result == "r"
+        assert abs(task.created_at - time.time()) < 5
+
+
 class TestCommandEndpoints:
     """Tests for /commands CRUD endpoints."""
 
@@ -729,8 +793,7 @@ class TestCommandDetectionInRun:
 
         with (
             patch("src.interfaces.api.tasks.parse_command") as mock_parse,
-            patch("src.interfaces.api.tasks.CommandExecutor") as mock_executor_class,
-            patch("src.interfaces.api.tasks.CommandRepository"),
+            patch("src.interfaces.api.tasks.get_command_executor") as mock_get_executor,
             patch("src.interfaces.api.tasks.AgentRunner") as mock_runner_class,
         ):
             from src.core.commands.parser import ParsedCommand
@@ -738,7 +801,7 @@ class TestCommandDetectionInRun:
             mock_parse.return_value = ParsedCommand(name="test", input="Seoul")
             mock_executor = MagicMock()
             mock_executor.execute.return_value = "Expanded prompt for Seoul"
-            mock_executor_class.return_value = mock_executor
+            mock_get_executor.return_value = mock_executor
 
             from src.interfaces.api.schemas import RunRequest
             from src.interfaces.api.tasks import execute_agent
@@ -810,8 +873,7 @@ class TestCommandDetectionInRun:
 
         with (
             patch("src.interfaces.api.tasks.parse_command") as mock_parse,
-            patch("src.interfaces.api.tasks.CommandExecutor") as mock_executor_class,
-            patch("src.interfaces.api.tasks.CommandRepository"),
+            patch("src.interfaces.api.tasks.get_command_executor") as mock_get_executor,
             patch("src.interfaces.api.tasks.AgentRunner") as mock_runner_class,
         ):
             from src.core.commands.parser import ParsedCommand
@@ -819,7 +881,7 @@ class TestCommandDetectionInRun:
             mock_parse.return_value = ParsedCommand(name="nonexistent", input="")
             mock_executor = MagicMock()
             mock_executor.execute.return_value = None
-            mock_executor_class.return_value = mock_executor
+            mock_get_executor.return_value = mock_executor
 
             from src.interfaces.api.schemas import RunRequest
             from src.interfaces.api.tasks import execute_agent
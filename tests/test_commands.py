@@ -914,6 +914,21 @@ class TestExecutor:
         assert "[Additional Instructions from User]" in result
         assert "영어로 답변해줘" in result
 
+    def test_get_command_executor_is_singleton(self, tmp_path, mocker) -> None:
+        """Test get_command_executor reuses one executor bound to the repository."""
+        from src.core.commands import executor as executor_module
+        from src.core.commands.repository import CommandRepository
+
+        repo = CommandRepository(db_path=str(tmp_path / "test.db"))
+        mocker.patch.object(executor_module, "_executor", None)
+        mocker.patch.object(executor_module, "get_repository", return_value=repo)
+
+        first = executor_module.get_command_executor()
+        second = executor_module.get_command_executor()
+
+        assert first is second
+        assert first.repository is repo
+
 
 class TestTools:
     """Test suite for command CRUD tools."""
@@ -1,7 +1,7 @@
 # tests/test_guardrails.py
 """Tests for the guardrails module."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -145,10 +145,75 @@ class TestCheckGuardrails:
         check_guardrails("gh_get_issue", (), {}, config)
         check_guardrails("sentry_list_issues", (), {}, config)
 
+    def test_allowed_calls_are_cached(self):
+        from src.middleware.guardrails import core
+
+        config = GuardrailConfig(read_only=True)
+        with patch.object(
+            core, "_check_guardrails_uncached", wraps=core._check_guardrails_uncached
+        ) as spy:
+            check_guardrails("read_file", (), {"path": "main.py"}, config)
+            check_guardrails("read_file", (), {"path": "main.py"}, config)
+            assert spy.call_count == 1
+
+            # Unhashable arguments are checked every time
+            check_guardrails("read_file", (), {"paths": ["main.py"]}, config)
+            check_guardrails("read_file", (), {"paths": ["main.py"]}, config)
+            assert spy.call_count == 3
+
+    def test_server_rules_aggregated_once_per_registry_version(self, monkeypatch):
+        from src.middleware.guardrails import core
+        from src.tools import mcp_registry
+        from src.tools.mcp_registry import ServerGuardrailRules
+
+        custom_check = MagicMock()
+        rules = [
+            ServerGuardrailRules(
+                write_tools=frozenset({"danger_tool"}), custom_check=custom_check
+            )
+        ]
+        monkeypatch.setattr(
+            mcp_registry, "_registry_version", mcp_registry._registry_version + 1
+        )
+        config = GuardrailConfig(read_only=True, block_sensitive_files=False)
+
+        with patch.object(
+            core, "get_all_guardrail_rules", return_value=rules
+        ) as mock_rules:
+            check_guardrails("search", (), {"query": "a"}, config)
+            check_guardrails("search", (), {"query": "b"}, config)
+            with pytest.raises(GuardrailViolation):
+                check_guardrails("danger_tool", (), {}, config)
+
+        mock_rules.assert_called_once()
+        assert custom_check.call_count == 2
+
+    def test_violations_are_not_cached(self):
+        config = GuardrailConfig(read_only=False, blocked_tools={"custom_tool"})
+        for _ in range(2):
+            with pytest.raises(GuardrailViolation):
+                check_guardrails("custom_tool", (), {"path": "file.txt"}, config)
+
 
 class TestCreateGuardrailHook:
     """Tests for create_guardrail_hook function."""
 
+    @pytest.mark.asyncio
+    async def test_permissive_config_skips_checks(self):
+        """Test that a config that blocks nothing forwards calls unchecked."""
+        from src.middleware.guardrails import core
+
+        config = GuardrailConfig(read_only=False, block_sensitive_files=False)
+        hook = create_guardrail_hook(config)
+        mock_call_tool = AsyncMock(return_value="ok")
+
+        with patch.object(core, "check_guardrails") as mock_check:
+            result = await hook(MagicMock(), mock_call_tool, "write_file", {})
+
+        assert result == "ok"
+        mock_check.assert_not_called()
+        mock_call_tool.assert_called_once_with("write_file", {}, None)
+
     @pytest.mark.asyncio
     async def test_hook_allows_safe_operations(self):
         """Test that hook allows safe read operations."""
@@ -266,6 +331,36 @@ class TestGuardrailConfig:
         assert "custom_blocked_tool" in blocked
         assert "write_file" in blocked
 
+    def test_configs_share_compiled_patterns(self):
+        first = GuardrailConfig(current_user_id="U1", sensitive_patterns={"*.key"})
+        second = GuardrailConfig(current_user_id="U2", sensitive_patterns={"*.key"})
+        assert first.compiled_rules().sensitive is second.compiled_rules().sensitive
+
+    def test_config_is_frozen_and_hashable(self):
+        from dataclasses import FrozenInstanceError
+
+        config = GuardrailConfig(blocked_tools={"custom_tool"})
+        assert config.blocked_tools == frozenset({"custom_tool"})
+        assert hash(config) == hash(GuardrailConfig(blocked_tools={"custom_tool"}))
+        with pytest.raises(FrozenInstanceError):
+            config.read_only = False
+
+    def test_compiled_rules_cached_until_registry_changes(self, monkeypatch):
+        from src.tools import mcp_registry
+
+        config = GuardrailConfig(
+            sensitive_patterns={"*.Secret"}, blocked_tools={"Custom_Tool"}
+        )
+        rules = config.compiled_rules()
+        assert config.compiled_rules() is rules
+        assert rules.sensitive.match("key.secret")
+        assert "custom_tool" in rules.blocked_tools
+
+        monkeypatch.setattr(
+            mcp_registry, "_registry_version", mcp_registry._registry_version + 1
+        )
+        assert config.compiled_rules() is not rules
+
 
 class TestCreateDefaultGuardrails:
     """Tests for create_default_guardrails function."""
@@ -89,6 +89,16 @@ class TestExtractImagesFromResult:
         result = {"content": [{"type": "text", "text": "No images"}]}
         assert extract_images_from_result(result) == []
 
+    def test_returns_empty_for_text_without_data_uri(self):
+        result = {
+            "content": [
+                {"type": "text", "text": "data:image/png but no payload"},
+                {"type": "text", "text": None},
+                "not a dict",
+            ]
+        }
+        assert extract_images_from_result(result) == []
+
     def test_skips_invalid_image_items(self):
         valid_data = base64.b64encode(b"valid").decode("utf-8")
 
@@ -168,6 +178,17 @@ class TestExtractDataUriImages:
         assert images[0].mime_type == "image/png"
         assert images[1].mime_type == "image/jpeg"
 
+    def test_extract_mime_type_with_dots(self):
+        """Should accept vendor MIME types containing dots."""
+        b64 = base64.b64encode(b"icon").decode()
+        text = f"data:image/vnd.microsoft.icon;base64,{b64}"
+
+        images = extract_data_uri_images(text)
+
+        assert len(images) == 1
+        assert images[0].mime_type == "image/vnd.microsoft.icon"
+        assert images[0].filename == "generated_0.vnd.microsoft.icon"
+
     def test_no_images_in_text(self):
         """Should return empty list when no data URIs present."""
         text = "Just some regular text without images"
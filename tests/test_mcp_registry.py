@@ -1,13 +1,17 @@
 # tests/test_mcp_registry.py
 """Tests for MCP server auto-registration framework."""
 
+from unittest.mock import patch
+
 import pytest
 
+from src.tools import mcp_registry
 from src.tools.mcp_registry import (
     MCPServerConfig,
     _registered_servers,
     auto_discover_mcp_servers,
     get_registered_servers,
+    load_from_json,
     register_mcp_server,
 )
 
@@ -114,7 +118,7 @@ class TestGetRegisteredServers:
     def teardown_method(self):
         _registered_servers.clear()
 
-    def test_returns_copy(self):
+    def test_returns_read_only_view(self):
         register_mcp_server(
             key="test",
             name="Test",
@@ -124,13 +128,14 @@ class TestGetRegisteredServers:
         )
         result = get_registered_servers()
         assert result == _registered_servers
-        # Modifying the copy should not affect the original
-        result["injected"] = MCPServerConfig(
-            name="Injected",
-            description="Injected",
-            command="npx",
-            args=[],
-        )
+        # The view cannot be used to modify the registry
+        with pytest.raises(TypeError):
+            result["injected"] = MCPServerConfig(
+                name="Injected",
+                description="Injected",
+                command="npx",
+                args=[],
+            )
         assert "injected" not in _registered_servers
 
     def test_empty_registry(self):
@@ -160,3 +165,29 @@ class TestAutoDiscoverMcpServers:
         # Discovers servers from src.tools.mcp
         result = auto_discover_mcp_servers("src.tools.mcp")
         assert isinstance(result, dict)
+
+
+class TestLoadFromJson:
+    """Tests for load_from_json() function."""
+
+    def test_reparses_only_when_file_changes(self, tmp_path):
+        path = tmp_path / "mcp.json"
+        path.write_text('{"mcpServers": {"one": {"command": "npx", "args": []}}}')
+
+        with patch(
+            "src.tools.mcp_registry.json.loads", wraps=mcp_registry.json.loads
+        ) as load:
+            assert list(load_from_json(str(path))) == ["one"]
+            assert list(load_from_json(str(path))) == ["one"]
+            assert load.call_count == 1
+
+            path.write_text(
+                '{"mcpServers": {"one": {"command": "npx", "args": []},'
+                ' "two": {"command": "uvx", "args": []}}}'
+            )
+            assert list(load_from_json(str(path))) == ["one", "two"]
+            assert load.call_count == 2
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_from_json(str(tmp_path / "missing.json"))
@@ -1,15 +1,24 @@
 # tests/test_playwright_cleanup.py
 """Tests for Playwright MCP cleanup utilities."""
 
+import asyncio
+import json
 import os
+import runpy
 import tempfile
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.tools import mcp_registry
+from src.tools.mcp import playwright
 from src.tools.mcp.playwright import (
     BROWSER_CLOSE_TOOL,
+    CHROMIUM_LAUNCH_ARGS,
+    SERVER_BASE_ARGS,
     PlaywrightCleanupTracker,
+    _server_args,
     cleanup_playwright_session,
     get_global_tracker,
     reset_global_tracker,
@@ -24,7 +33,7 @@ class TestPlaywrightCleanupTracker:
         tracker = PlaywrightCleanupTracker()
         assert not tracker.browser_opened
         assert not tracker.browser_closed
-        assert tracker.screenshot_files == []
+        assert tracker.screenshot_files == set()
         assert not tracker.needs_browser_cleanup
         assert not tracker.needs_file_cleanup
 
@@ -62,6 +71,16 @@ class TestPlaywrightCleanupTracker:
         tracker.track_tool_call("pw_browser_click", {})
         assert tracker.browser_opened
 
+    def test_track_screenshot_path_deduplicated(self):
+        """Test that repeated screenshots to one path are tracked once."""
+        tracker = PlaywrightCleanupTracker()
+        for _ in range(3):
+            tracker.track_tool_call(
+                "browser_take_screenshot", {"path": "/tmp/screenshot.png"}
+            )
+
+        assert tracker.screenshot_files == {"/tmp/screenshot.png"}
+
     def test_track_screenshot_path(self):
         """Test tracking screenshot file paths."""
         tracker = PlaywrightCleanupTracker()
@@ -163,7 +182,7 @@ class TestPlaywrightCleanupTracker:
         ) as f:
             temp_path = f.name
 
-        tracker.screenshot_files.append(temp_path)
+        tracker.screenshot_files.add(temp_path)
         assert os.path.exists(temp_path)
 
         # Cleanup
@@ -171,7 +190,60 @@ class TestPlaywrightCleanupTracker:
 
         assert deleted >= 1
         assert not os.path.exists(temp_path)
-        assert tracker.screenshot_files == []
+        assert tracker.screenshot_files == set()
+
+    def test_cleanup_many_tracked_files(self, tmp_path):
+        """Test that many tracked files are all deleted (thread pool path)."""
+        tracker = PlaywrightCleanupTracker(temp_dir=str(tmp_path / "scan"))
+        paths = [tmp_path / f"shot_{i}.png" for i in range(20)]
+        for path in paths:
+            path.write_bytes(b"")
+        tracker.screenshot_files.update(str(p) for p in paths)
+        tracker.screenshot_files.add(str(tmp_path / "missing.png"))
+
+        deleted = tracker.cleanup_screenshot_files()
+
+        assert deleted == 20
+        assert not any(p.exists() for p in paths)
+        assert tracker.screenshot_files == set()
+
+    def test_cleanup_old_temp_screenshots(self, tmp_path):
+        """Test that only old files matching a screenshot prefix are swept."""
+        old = time.time() - 3600
+        tracker = PlaywrightCleanupTracker(temp_dir=str(tmp_path), _session_start=old)
+
+        names = [
+            "screenshot_a.png",
+            "playwright_screenshot_b.png",
+            "browser_screenshot_c.png",
+            "other_d.png",
+            "screenshot_e.jpg",
+        ]
+        for name in names:
+            path = tmp_path / name
+            path.write_bytes(b"")
+            os.utime(path, (old, old))
+        (tmp_path / "screenshot_fresh.png").write_bytes(b"")
+
+        deleted = tracker.cleanup_screenshot_files(max_age_minutes=30)
+
+        assert deleted == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "other_d.png",
+            "screenshot_e.jpg",
+            "screenshot_fresh.png",
+        ]
+
+    def test_young_session_skips_temp_sweep(self, tmp_path):
+        """Test that the temp dir is not swept before the session is old."""
+        tracker = PlaywrightCleanupTracker(temp_dir=str(tmp_path))
+        path = tmp_path / "screenshot_old.png"
+        path.write_bytes(b"")
+        old = time.time() - 3600
+        os.utime(path, (old, old))
+
+        assert tracker.cleanup_screenshot_files(max_age_minutes=30) == 0
+        assert path.exists()
 
     @pytest.mark.asyncio
     async def test_full_cleanup(self):
@@ -185,7 +257,7 @@ class TestPlaywrightCleanupTracker:
             delete=False,
         ) as f:
             temp_path = f.name
-        tracker.screenshot_files.append(temp_path)
+        tracker.screenshot_files.add(temp_path)
 
         mcp_call = AsyncMock()
         results = await tracker.cleanup(mcp_call=mcp_call)
@@ -207,17 +279,32 @@ class TestPlaywrightCleanupTracker:
         results = await tracker.cleanup(mcp_call=mcp_call)
         assert results.get("skipped")
 
+    @pytest.mark.asyncio
+    async def test_concurrent_cleanup_runs_once(self):
+        """Test that concurrent cleanups close the browser only once."""
+        tracker = PlaywrightCleanupTracker()
+        tracker.track_tool_call("browser_navigate", {})
+
+        mcp_call = AsyncMock()
+        results = await asyncio.gather(
+            tracker.cleanup(mcp_call=mcp_call),
+            tracker.cleanup(mcp_call=mcp_call),
+        )
+
+        mcp_call.assert_called_once_with(BROWSER_CLOSE_TOOL, {})
+        assert sorted(bool(r["skipped"]) for r in results) == [False, True]
+
     def test_reset(self):
         """Test tracker reset."""
         tracker = PlaywrightCleanupTracker()
         tracker.track_tool_call("browser_navigate", {})
-        tracker.screenshot_files.append("/tmp/test.png")
+        tracker.screenshot_files.add("/tmp/test.png")
 
         tracker.reset()
 
         assert not tracker.browser_opened
         assert not tracker.browser_closed
-        assert tracker.screenshot_files == []
+        assert tracker.screenshot_files == set()
 
 
 class TestGlobalTracker:
@@ -256,3 +343,50 @@ class TestGlobalTracker:
         results = await cleanup_playwright_session(mcp_call=mcp_call)
 
         assert results["browser_closed"]
+
+
+class TestServerArgs:
+    """Tests for Playwright MCP server arguments."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_tempdir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    def test_server_args_pass_launch_config(self, monkeypatch):
+        """Test that Chromium launch flags are passed via a --config file."""
+        monkeypatch.delenv("PLAYWRIGHT_MCP_BLOCK_RESOURCES", raising=False)
+        args = _server_args()
+
+        assert args[:4] == list(SERVER_BASE_ARGS)
+        config_arg = args[-1]
+        assert config_arg.startswith("--config=")
+        with open(config_arg.removeprefix("--config="), encoding="utf-8") as f:
+            config = json.load(f)
+        assert config["browser"]["launchOptions"]["args"] == list(CHROMIUM_LAUNCH_ARGS)
+
+    def test_server_args_block_resources(self, monkeypatch):
+        """Test that resource blocking is opt-in via environment variables."""
+        monkeypatch.setenv("PLAYWRIGHT_MCP_BLOCK_RESOURCES", "1")
+        monkeypatch.setenv(
+            "PLAYWRIGHT_MCP_BLOCK_PATTERNS", "https://ads.example.com, https://t.co"
+        )
+
+        config_arg = _server_args()[-1]
+        with open(config_arg.removeprefix("--config="), encoding="utf-8") as f:
+            config = json.load(f)
+
+        launch_args = config["browser"]["launchOptions"]["args"]
+        assert "--blink-settings=imagesEnabled=false" in launch_args
+        assert config["network"]["blockedOrigins"] == [
+            "https://ads.example.com",
+            "https://t.co",
+        ]
+
+    def test_registration_defers_config_file(self, tmp_path, monkeypatch):
+        """Test that importing the module does not write the config file."""
+        monkeypatch.delitem(mcp_registry._registered_servers, "playwright", False)
+        runpy.run_path(playwright.__file__)
+
+        assert list(tmp_path.iterdir()) == []
+        config = mcp_registry._registered_servers["playwright"]
+        assert config.build_args()[-1].startswith(f"--config={tmp_path}")
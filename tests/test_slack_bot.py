@@ -294,6 +294,7 @@ class TestSlackBotCommandIntegration:
         db_path = tmp_path / "test_commands.db"
         from datetime import datetime
 
+        from src.core.commands.executor import CommandExecutor
         from src.core.commands.models import Command
         from src.core.commands.repository import CommandRepository
 
@@ -312,7 +313,10 @@ class TestSlackBotCommandIntegration:
             )
         )
 
-        with patch("src.interfaces.slack.handlers.get_repository", return_value=repo):
+        with patch(
+            "src.interfaces.slack.handlers.get_command_executor",
+            return_value=CommandExecutor(repo),
+        ):
             event = {
                 "text": "<@U123> !weather Seoul",
                 "ts": "1234567890.123456",
@@ -351,6 +355,7 @@ class TestSlackBotCommandIntegration:
         db_path = tmp_path / "test_commands.db"
         from datetime import datetime
 
+        from src.core.commands.executor import CommandExecutor
         from src.core.commands.models import Command
         from src.core.commands.repository import CommandRepository
 
@@ -369,7 +374,10 @@ class TestSlackBotCommandIntegration:
             )
         )
 
-        with patch("src.interfaces.slack.handlers.get_repository", return_value=repo):
+        with patch(
+            "src.interfaces.slack.handlers.get_command_executor",
+            return_value=CommandExecutor(repo),
+        ):
             event = {
                 "text": "!help",
                 "ts": "1234567890.123456",
@@ -413,11 +421,15 @@ class TestSlackBotCommandIntegration:
         handlers._run_agent_with_progress = mock_progress
 
         db_path = tmp_path / "test_commands_empty.db"
+        from src.core.commands.executor import CommandExecutor
         from src.core.commands.repository import CommandRepository
 
         repo = CommandRepository(str(db_path))
 
-        with patch("src.interfaces.slack.handlers.get_repository", return_value=repo):
+        with patch(
+            "src.interfaces.slack.handlers.get_command_executor",
+            return_value=CommandExecutor(repo),
+        ):
             event = {
                 "text": "<@U123> !nonexistent Seoul",
                 "ts": "1234567890.123456",
@@ -473,3 +485,171 @@ class TestSlackBotCommandIntegration:
 
         assert len(captured_message) == 1
         assert captured_message[0] == "hello agent, what is the weather?"
+
+
+class TestProgressDebouncer:
+    """Test coalescing of tool progress updates."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_tool_calls_sends_single_update(self):
+        """Test that rapid tool calls produce one update showing the latest tool."""
+        import asyncio
+
+        from src.interfaces.slack.progress import _ProgressDebouncer
+
+        mock_client = AsyncMock()
+        debouncer = _ProgressDebouncer(mock_client, "C123", "1.0", interval=0.01)
+
+        for tool_name in ("fetch", "search", "git_status"):
+            await debouncer(tool_name)
+        await asyncio.sleep(0.05)
+
+        mock_client.chat_update.assert_called_once()
+        assert "git_status" in mock_client.chat_update.call_args[1]["text"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_pending_update(self):
+        """Test that cancel() prevents a pending update from being sent."""
+        import asyncio
+
+        from src.interfaces.slack.progress import _ProgressDebouncer
+
+        mock_client = AsyncMock()
+        debouncer = _ProgressDebouncer(mock_client, "C123", "1.0", interval=0.01)
+
+        await debouncer("fetch")
+        debouncer.cancel()
+        await asyncio.sleep(0.05)
+
+        mock_client.chat_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_update_is_logged(self, caplog):
+        """Test that a failing chat_update is logged instead of escaping."""
+        import asyncio
+
+        from src.interfaces.slack.progress import _ProgressDebouncer
+
+        mock_client = AsyncMock()
+        mock_client.chat_update.side_effect = RuntimeError("channel_not_found")
+        debouncer = _ProgressDebouncer(mock_client, "C123", "1.0", interval=0.01)
+
+        await debouncer("fetch")
+        await asyncio.sleep(0.05)
+
+        assert debouncer._task.exception() is None
+        assert "Failed to update tool progress" in caplog.text
+
+
+class TestToolEmoji:
+    """Test tool name to emoji mapping."""
+
+    def test_first_matching_key_wins(self):
+        """Test that TOOL_EMOJI order decides between several matching keys."""
+        from src.interfaces.slack.progress import _get_tool_emoji
+
+        assert _get_tool_emoji("git_search") == ":mag:"
+        assert _get_tool_emoji("Read_Delete") == ":page_facing_up:"
+        assert _get_tool_emoji("browser_navigate") == ":gear:"
+
+
+class TestMultipartMessage:
+    """Test sending long responses as multiple Slack messages."""
+
+    @pytest.mark.asyncio
+    async def test_updates_first_part_and_posts_rest(self):
+        """Test that part 1 updates the progress message and the rest are posted."""
+        from src.interfaces.slack.slack_api import _send_multipart_message
+
+        mock_client = AsyncMock()
+        text = "\n\n".join(["word " * 400] * 3)
+
+        await _send_multipart_message(
+            mock_client, "C123", "1.0", text, update_first_ts="2.0"
+        )
+
+        mock_client.chat_update.assert_called_once()
+        assert mock_client.chat_update.call_args[1]["ts"] == "2.0"
+        posted = [c[1]["text"] for c in mock_client.chat_postMessage.call_args_list]
+        assert [t[-5:] for t in posted] == ["(2/3)", "(3/3)"]
+
+    @pytest.mark.asyncio
+    async def test_msg_too_long_part_is_resplit(self):
+        """Test that a part rejected as too long is re-sent in smaller pieces."""
+        from slack_sdk.errors import SlackApiError
+
+        from src.interfaces.slack.slack_api import _send_multipart_message
+
+        async def post_message(**kwargs):
+            if kwargs["text"].endswith("(2/2)"):
+                raise SlackApiError("too long", {"error": "msg_too_long"})
+
+        mock_client = AsyncMock()
+        mock_client.chat_postMessage.side_effect = post_message
+        text = "\n\n".join(["word " * 400] * 2)
+
+        await _send_multipart_message(mock_client, "C123", "1.0", text)
+
+        # Part 1, the rejected part 2, then part 2 re-split into 1000-char pieces
+        assert mock_client.chat_postMessage.call_count == 4
+
+
+class TestSlackApiRetry:
+    """Test retry behaviour of Slack API calls."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_waits_for_retry_after(self):
+        """Test that a ratelimited error is retried after Slack's Retry-After."""
+        from slack_sdk.errors import SlackApiError
+
+        from src.interfaces.slack.slack_api import _slack_api_with_retry
+
+        response = MagicMock()
+        response.get.return_value = "ratelimited"
+        response.headers = {"Retry-After": "3"}
+        api_call = AsyncMock(side_effect=[SlackApiError("limited", response), "ok"])
+
+        with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            assert await _slack_api_with_retry(api_call) == "ok"
+
+        mock_sleep.assert_awaited_once_with(3.0)
+
+    @pytest.mark.asyncio
+    async def test_other_api_errors_are_not_retried(self):
+        """Test that non rate-limit API errors are raised immediately."""
+        from slack_sdk.errors import SlackApiError
+
+        from src.interfaces.slack.slack_api import _slack_api_with_retry
+
+        error = SlackApiError("not found", {"error": "channel_not_found"})
+        api_call = AsyncMock(side_effect=error)
+
+        with pytest.raises(SlackApiError):
+            await _slack_api_with_retry(api_call)
+        api_call.assert_awaited_once()
+
+
+class TestSplitMessage:
+    """Test splitting long messages at natural boundaries."""
+
+    def test_splits_at_paragraphs_without_losing_text(self):
+        """Test that chunks fit the limit and keep every word in order."""
+        from src.interfaces.slack.slack_api import _split_message_at_boundaries
+
+        paragraphs = [f"paragraph {i} " + "word " * 60 for i in range(20)]
+        text = "\n\n".join(paragraphs)
+
+        chunks = _split_message_at_boundaries(text, limit=1000)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert all(chunk.startswith("paragraph") for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_hard_splits_text_without_break_points(self):
+        """Test that text without whitespace is split at the limit."""
+        from src.interfaces.slack.slack_api import _split_message_at_boundaries
+
+        chunks = _split_message_at_boundaries("x" * 2500, limit=1000)
+
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]